@@ -5,6 +5,22 @@ class AppConfigs(BaseSettings):
     DEBUG: bool
     DEV: str
     PROD: str
+    # event-loop lag / blocking-call monitor (utils/loop_monitor.py)
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_MS: float = 100
+    LOOP_MONITOR_BLOCK_THRESHOLD_MS: float = 200
+    # per-request profiling (middlewares/profiler.py); header profiling needs PROFILING_SECRET
+    PROFILING_ENABLED: bool = False
+    PROFILING_SECRET: str = ""
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_MAX_SKEW_S: int = 300
+    PROFILING_MODE: str = "deterministic"  # or "sampling" (requires pyinstrument)
+    PROFILING_DIR: str = "profiles"
+    # span export (utils/tracing.py); spans and log trace ids exist regardless, this only ships them
+    TRACING_ENABLED: bool = False
+    TRACING_FILE_PATH: str = ""  # JSONL sink, e.g. logs/spans.jsonl
+    TRACING_OTLP_ENDPOINT: str = ""  # e.g. http://localhost:4318/v1/traces
+    TRACING_SERVICE_NAME: str = "fundos"
     
 
     class Config:
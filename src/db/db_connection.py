@@ -0,0 +1,5 @@
+from configs.db_configs import DbConfigs
+from services.db_services import DatabaseServices
+
+db_configs = DbConfigs()
+db_services = DatabaseServices(db_url=db_configs.DB_URL)
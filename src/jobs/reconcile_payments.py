@@ -0,0 +1,21 @@
+import argparse
+import asyncio
+import json
+from db.db_connection import db_services
+from services.reconciliation_service import ReconciliationService
+
+def main() -> None:
+    """
+    Reconcile pending investments against a gateway settlement file.
+    Usage: make reconcile FILE=settlement.csv [REPORT=mismatches.jsonl]
+    """
+    parser = argparse.ArgumentParser(description="Reconcile pending investments against a settlement file")
+    parser.add_argument("settlement_path", help="CSV or JSONL settlement file")
+    parser.add_argument("--report", default="reconciliation-mismatches.jsonl", help="JSONL mismatch report path")
+    args = parser.parse_args()
+
+    summary = asyncio.run(ReconciliationService(db_services=db_services).reconcile_file(args.settlement_path, args.report))
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,21 @@ import os
 from logging.handlers import RotatingFileHandler
 from datetime import datetime
 from pythonjsonlogger import jsonlogger
+from utils.tracing import current_span
 
 # Create logs directory if it doesn't exist
 LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
 os.makedirs(LOGS_DIR, exist_ok=True)
 
+class TraceContextFilter(logging.Filter):
+    """Stamps records with the active trace/span ids so logs can be joined with exported spans."""
+
+    def filter(self, record):
+        span = current_span()
+        record.trace_id = span.trace_id if span else "-"
+        record.span_id = span.span_id if span else "-"
+        return True
+
 # Define a formatter
 class CustomFormatter(logging.Formatter):
     """Custom formatter for more readable logs."""
@@ -16,7 +26,7 @@ class CustomFormatter(logging.Formatter):
     red = "\x1b[31;21m"
     bold_red = "\x1b[31;1m"
     reset = "\x1b[0m"
-    format = "%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | %(message)s"
+    format = "%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | trace=%(trace_id)s | %(message)s"
 
     FORMATS = {
         logging.DEBUG: grey + format + reset,
@@ -33,7 +43,7 @@ class CustomFormatter(logging.Formatter):
 
 class JsonFormatter(jsonlogger.JsonFormatter):
     def __init__(self):
-        super().__init__(fmt='%(asctime)s %(levelname)s %(name)s %(module)s %(filename)s %(lineno)d %(message)s')
+        super().__init__(fmt='%(asctime)s %(levelname)s %(name)s %(module)s %(filename)s %(lineno)d %(trace_id)s %(span_id)s %(message)s')
 
     def process_log_record(self, log_record):
         # Add any additional processing if needed
@@ -69,10 +79,14 @@ def get_logger(module_name: str, env: str = "dev") -> logging.Logger:
 
         console_handler.setFormatter(CustomFormatter())
         file_handler.setFormatter(logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | %(message)s",
+            "%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | trace=%(trace_id)s span=%(span_id)s | %(message)s",
             datefmt='%Y-%m-%d %H:%M:%S'
         ))
 
+    trace_filter = TraceContextFilter()
+    console_handler.addFilter(trace_filter)
+    file_handler.addFilter(trace_filter)
+
     logger.addHandler(console_handler)
     logger.addHandler(file_handler)
 
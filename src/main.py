@@ -3,17 +3,27 @@ from fastapi.responses import JSONResponse
 from configs.app_configs import AppConfigs
 from routes.index import router as indexRouter
 from routes.kyc import router as kycRouter
+from routes.deal import router as dealRouter
+from routes.user import router as userRouter
+from routes.investment import router as investmentRouter
 from middlewares.request_logger import request_logging_middleware
+from middlewares.profiler import make_profiling_middleware
 from utils.lifespan import lifespan
 
+app_configs = AppConfigs()
+
 app = FastAPI(lifespan=lifespan) 
 # Register the middleware using FastAPI's .middleware() method
+# (the last one registered runs outermost, so the profiler sits closest to the route)
+if app_configs.PROFILING_ENABLED:
+    app.middleware("http")(make_profiling_middleware(app_configs))
 app.middleware("http")(request_logging_middleware) 
 
 app.include_router(router=indexRouter, prefix="/api/v1")
 app.include_router(router=kycRouter, prefix="/api/v1/kyc")
-
-app_configs = AppConfigs()
+app.include_router(router=dealRouter, prefix="/api/v1/deals")
+app.include_router(router=userRouter, prefix="/api/v1/users")
+app.include_router(router=investmentRouter, prefix="/api/v1/investments")
 
 @app.get("/")
 async def root(): 
@@ -0,0 +1,117 @@
+from fastapi import Request
+import asyncio
+import cProfile
+import hashlib
+import hmac
+import os
+import random
+import re
+import time
+import uuid
+
+from configs.app_configs import AppConfigs
+from logging.logging_setup import get_logger
+
+try:
+    from pyinstrument import Profiler as SamplingProfiler  # optional, async-aware sampling profiler
+except ImportError:
+    SamplingProfiler = None
+
+logger = get_logger("profiler")
+
+PROFILE_HEADER = "x-debug-profile"
+UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+def sign_profile_request(secret: str, path: str, timestamp: int | None = None) -> str:
+    """
+    Build an `X-Debug-Profile` header value: `<unix ts>.<hmac-sha256(secret, "<ts>:<path>")>`.
+    """
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    signature = hmac.new(secret.encode(), f"{timestamp}:{path}".encode(), hashlib.sha256).hexdigest()
+    return f"{timestamp}.{signature}"
+
+def make_profiling_middleware(app_configs: AppConfigs):
+    """
+    Profile a request when it carries a valid signed `X-Debug-Profile` header, or when it is
+    sampled at `PROFILING_SAMPLE_RATE`, and write the profile to `PROFILING_DIR` named after
+    the route and request id. Register it only when `PROFILING_ENABLED` is set (see main.py),
+    so requests pay nothing for it otherwise.
+
+    In deterministic mode cProfile hooks the loop thread, so the profile also contains every
+    other coroutine that ran while the request was in flight, not just this request; use
+    PROFILING_MODE=sampling (pyinstrument, async-aware) to attribute time to one request.
+    """
+    secret = app_configs.PROFILING_SECRET
+    sample_rate = app_configs.PROFILING_SAMPLE_RATE
+    max_skew = app_configs.PROFILING_MAX_SKEW_S
+    profiles_dir = app_configs.PROFILING_DIR
+    use_sampler = app_configs.PROFILING_MODE == "sampling" and SamplingProfiler is not None
+    if app_configs.PROFILING_MODE == "sampling" and SamplingProfiler is None:
+        logger.warning("PROFILING_MODE=sampling needs pyinstrument; falling back to cProfile")
+
+    # cProfile hooks the whole thread, so only one deterministic profile can run at a time
+    cprofile_busy = asyncio.Lock()
+
+    def should_profile(request: Request) -> bool:
+        header = request.headers.get(PROFILE_HEADER)
+        if header and secret:
+            timestamp, _, _ = header.partition(".")
+            if timestamp.isdigit() and abs(time.time() - int(timestamp)) <= max_skew:
+                expected = sign_profile_request(secret, request.url.path, int(timestamp))
+                if hmac.compare_digest(header, expected):
+                    return True
+            logger.warning(f"Rejected profiling header for {request.url.path}")
+        return sample_rate > 0 and random.random() < sample_rate
+
+    def profile_path(request: Request, request_id: str, extension: str) -> str:
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+        route_name = UNSAFE_FILENAME_CHARS.sub("_", f"{request.method}{route_path}").strip("_")
+        return os.path.join(profiles_dir, f"{time.strftime('%Y%m%dT%H%M%S')}-{route_name}-{request_id}.{extension}")
+
+    async def run_sampled(request: Request, call_next, request_id: str):
+        profiler = SamplingProfiler(async_mode="enabled")
+        profiler.start()
+        try:
+            response = await call_next(request)
+        finally:
+            profiler.stop()
+        path = profile_path(request, request_id, "html")
+        await asyncio.to_thread(_write_text, path, profiler.output_html())
+        return response, path
+
+    async def run_deterministic(request: Request, call_next, request_id: str):
+        if cprofile_busy.locked():
+            logger.info(f"Skipping profile of {request.url.path}: another cProfile session is running")
+            return await call_next(request), None
+
+        async with cprofile_busy:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                response = await call_next(request)
+            finally:
+                profiler.disable()
+        path = profile_path(request, request_id, "prof")
+        await asyncio.to_thread(profiler.dump_stats, path)
+        return response, path
+
+    async def profiling_middleware(request: Request, call_next):
+        if not app_configs.PROFILING_ENABLED or not should_profile(request):
+            return await call_next(request)
+
+        request_id = UNSAFE_FILENAME_CHARS.sub("_", request.headers.get("x-request-id", ""))[:64] or uuid.uuid4().hex
+        os.makedirs(profiles_dir, exist_ok=True)
+        runner = run_sampled if use_sampler else run_deterministic
+        response, path = await runner(request, call_next, request_id)
+
+        if path is not None:
+            logger.info({"event": "profile", "path": request.url.path, "request_id": request_id, "file": path})
+            response.headers["X-Profile-File"] = os.path.basename(path)
+        return response
+
+    return profiling_middleware
+
+def _write_text(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as profile_file:
+        profile_file.write(content)
@@ -3,6 +3,7 @@ import time
 import json
 
 from logging.logging_setup import get_logger  # import your own get_logger
+from utils.tracing import start_span, TRACEPARENT_HEADER
 
 logger = get_logger("request-logger")
 
@@ -26,34 +27,49 @@ async def log_response_data(response) -> dict:
 async def request_logging_middleware(request: Request, call_next):
     start_time = time.time()
 
-    request_info = {
-        "method": request.method,
-        "url": str(request.url),
-        "headers": dict(request.headers),
-        "query_params": dict(request.query_params),
-        "body": await log_request_data(request),
-    }
+    # root span for the request; services, httpx, boto3 and DB calls hang child spans off it
+    with start_span(
+        f"HTTP {request.method} {request.url.path}",
+        kind="server",
+        traceparent=request.headers.get(TRACEPARENT_HEADER),
+        **{"http.method": request.method, "http.path": request.url.path},
+    ) as span:
+        request_info = {
+            "method": request.method,
+            "url": str(request.url),
+            "headers": dict(request.headers),
+            "query_params": dict(request.query_params),
+            "body": await log_request_data(request),
+        }
 
-    try:
-        response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
-
-        logger.info(
-            {
-                "event": "request",
-                "request": request_info,
-                "response_status": response.status_code,
-                "process_time_ms": f"{process_time:.2f}",
-            }
-        )
-        return response
-
-    except Exception as exc:
-        logger.exception(
-            {
-                "event": "exception",
-                "request": request_info,
-                "error": str(exc)
-            }
-        )
-        raise exc
+        try:
+            response = await call_next(request)
+            process_time = (time.time() - start_time) * 1000
+
+            route = request.scope.get("route")
+            if route is not None:
+                span.name = f"HTTP {request.method} {route.path}"
+            span.attributes["http.status_code"] = response.status_code
+            response.headers[TRACEPARENT_HEADER] = span.traceparent
+
+            logger.info(
+                {
+                    "event": "request",
+                    "request": request_info,
+                    "response_status": response.status_code,
+                    "process_time_ms": f"{process_time:.2f}",
+                    "trace_id": span.trace_id,
+                }
+            )
+            return response
+
+        except Exception as exc:
+            logger.exception(
+                {
+                    "event": "exception",
+                    "request": request_info,
+                    "error": str(exc),
+                    "trace_id": span.trace_id,
+                }
+            )
+            raise exc
@@ -0,0 +1,26 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime, timezone
+from enum import Enum
+import uuid
+
+class KycEventType(str, Enum):
+    AADHAAR_OTP_SENT = "aadhaar_otp_sent"
+    AADHAAR_OTP_SUBMITTED = "aadhaar_otp_submitted"
+    AADHAAR_OTP_RESENT = "aadhaar_otp_resent"
+    PAN_VERIFIED = "pan_verified"
+    PHONE_VERIFICATION_SENT = "phone_verification_sent"
+    PHONE_OTP_VERIFIED = "phone_otp_verified"
+
+class AuditOutcome(str, Enum):
+    SUCCESS = "success"
+    FAILURE = "failure"
+
+class KycAuditEvent(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    event_type: KycEventType = Field(index=True)
+    subject_ref: str = Field(index=True)  # unique_id / session uuid / masked phone, never the raw Aadhaar or PAN
+    outcome: AuditOutcome
+    status_code: Optional[int] = None  # HTTP status surfaced to the client
+    detail: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
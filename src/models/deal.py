@@ -1,9 +1,8 @@
 from sqlmodel import SQLModel, Field
-from typing import Optional, List
+from typing import Optional
 from datetime import datetime, timezone
 from enum import Enum 
 import uuid
-from .investment import Investment
 
 class DealStatus(str, Enum): 
     OPEN = "open"
@@ -11,14 +10,14 @@ class DealStatus(str, Enum):
     ON_HOLD = "on_hold" 
 
 class Deal(SQLModel, table=True):
-    id: uuid.UUID = Field(default=None, primary_key=True, default_factory=uuid.uuid4())
-    fund_manager_id: int = Field(foreign_key="user.id")
+    id: uuid.UUID = Field(primary_key=True, default_factory=uuid.uuid4)
+    fund_manager_id: int = Field(foreign_key="user.id", index=True)
     title: str
     description: str
     amount: float
-    status: DealStatus = Field(default=DealStatus.OPEN)  # open, closed, funded
-    created_at: datetime = Field(default_factory=datetime.now(timezone.utc))
+    status: DealStatus = Field(default=DealStatus.OPEN, index=True)  # open, closed, funded
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime]
     # fund_manager: Optional[User] = Relationship(back_populates="deals")
-    investment_ids: List[int] = Field(foreign_key= Investment.id) # current it is int -> change it to uuid later. think about relationship back propogation. 
+    # investments: List["Investment"] = Relationship(back_populates="deal")  # a list column cannot be mapped; investments point here via Investment.deal_id
     legal_document_url: Optional[str]  # Zoho Sign document s3 object url 
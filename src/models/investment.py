@@ -11,14 +11,15 @@ class PaymentStatus(str, Enum):
     ON_HOLD = "on_hold"
 
 class Investment(SQLModel, table=True):
-    id: uuid.UUID = Field(default=None, primary_key=True, default_factory=uuid.uuid4())
-    investor_id: int = Field(foreign_key="user.id")
-    deal_id: int = Field(foreign_key="deal.id")
+    id: uuid.UUID = Field(primary_key=True, default_factory=uuid.uuid4)
+    investor_id: uuid.UUID = Field(foreign_key="user.id", index=True)
+    deal_id: uuid.UUID = Field(foreign_key="deal.id", index=True)
     amount: float
     payment_status: PaymentStatus = Field(default=PaymentStatus.PENDING)  # pending, completed, failed
     payment_id: Optional[str]  # Razorpay/PayU payment ID
+    allocated_amount: Optional[float] = None  # pro-rata allocation when the deal is oversubscribed
     signed_document_url: Optional[str]  # Zoho Sign signed document ID
-    created_at: datetime = Field(default_factory=datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime]
     # investor: Optional[User] = Relationship(back_populates="investments")
     # deal: Optional[Deal] = Relationship(back_populates="investments")
\ No newline at end of file
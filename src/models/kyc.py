@@ -6,7 +6,7 @@ import uuid
 from .user import KycStatus
 
 class KYC(SQLModel, table=True):
-    id: uuid.UUID = Field(default=None, primary_key=True, default_factory=uuid.uuid4())
+    id: uuid.UUID = Field(primary_key=True, default_factory=uuid.uuid4)
     user_id: int = Field(foreign_key="user.id")
     aadhaar_number: Optional[str]  # Encrypted
     pan_number: Optional[str]  # Encrypted
@@ -14,5 +14,5 @@ class KYC(SQLModel, table=True):
     bank_ifsc: Optional[str]
     status: KycStatus = Field(default=KycStatus.PENDING)  # pending, verified, rejected
     # verification_details: Optional[str]  # JSON string from Digitap API 
-    created_at: datetime = Field(default_factory=datetime.now(timezone.utc)) 
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc)) 
     updated_at: datetime = Field(default=datetime.now(timezone.utc))
\ No newline at end of file
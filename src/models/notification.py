@@ -0,0 +1,24 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime, timezone
+from enum import Enum
+import uuid
+
+class CampaignStatus(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+
+class SmsCampaign(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    deal_id: uuid.UUID = Field(foreign_key="deal.id", unique=True)  # one announcement per deal
+    fund_manager_id: int = Field(index=True)
+    message: str
+    status: CampaignStatus = Field(default=CampaignStatus.RUNNING, index=True)
+    last_user_id: Optional[uuid.UUID] = None  # keyset cursor: every recipient up to here has been handled
+    sent_count: int = Field(default=0)
+    failed_count: int = Field(default=0)
+    skipped_count: int = Field(default=0)  # recipients without a usable phone number
+    claimed_by: Optional[str] = None  # worker currently sending; see DealAnnouncementService
+    lease_expires_at: Optional[datetime] = None  # claim is void after this, so a crashed worker's campaign can be taken over
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: Optional[datetime] = None
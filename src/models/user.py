@@ -18,7 +18,7 @@ class KycStatus(str, Enum):
     REJECTED = "rejected" 
 
 class User(SQLModel, table=True):
-    id: uuid.UUID = Field(default=None, primary_key=True, default_factory=uuid.uuid4())
+    id: uuid.UUID = Field(primary_key=True, default_factory=uuid.uuid4)
     invitation_code: str = Field(index=True)  # Generated by fund manager
     email: Optional[str] = Field(unique=True, index=True)
     phone_number: Optional[str] = Field(unique=True, index=True)
@@ -28,7 +28,7 @@ class User(SQLModel, table=True):
     income_source: float = Field()
     annual_income: float = Field()
     capital_commitment: float = Field() 
-    created_at: datetime = Field(default_factory=datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime]
     fund_manager_id: Optional[int] = Field(foreign_key="user.id")  # For investors/founders under a fund manager
     kyc_status: KycStatus = Field(default=KycStatus.PENDING)  # pending, verified, rejected
@@ -0,0 +1,89 @@
+import uuid
+from typing import Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request
+from models.deal import DealStatus
+from schemas.deal import (
+    DealCreate, DealUpdate, DealOut, DealSearchHit, DealSearchResponse, AllocationRequest, AllocationResult
+)
+from services.allocation_service import AllocationService
+from services.deal_service import DealService
+from services.notification_service import DealAnnouncementService
+from services.phone_service import PhoneService
+from utils.etag import conditional_json, make_etag
+from db.db_connection import db_services
+
+deal_service = DealService(db_services=db_services) # search index is created in lifespan
+allocation_service = AllocationService(db_services=db_services)
+announcement_service = DealAnnouncementService(db_services=db_services, phone_service=PhoneService()) # investor SMS on deal open
+
+router = APIRouter()
+
+@router.get('/search', response_model=DealSearchResponse)
+async def search_deals(
+    q: str = Query(min_length=1, max_length=200),
+    status: Optional[DealStatus] = None,
+    fund_manager_id: Optional[int] = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+):
+    hits = await deal_service.search_deals(q, status=status, fund_manager_id=fund_manager_id, limit=limit, offset=offset)
+    return DealSearchResponse(
+        query=q,
+        results=[DealSearchHit(**deal.model_dump(), score=score) for deal, score in hits]
+    )
+
+@router.get('/{deal_id}', response_model=DealOut)
+async def get_deal(deal_id: uuid.UUID, request: Request):
+    version = await deal_service.get_deal_version(deal_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Deal not found")
+
+    async def build():
+        return DealOut(**(await deal_service.get_deal(deal_id)).model_dump())
+
+    return await conditional_json(request, make_etag(*version), ("deal", deal_id), build)
+
+@router.post('/', response_model=DealOut)
+async def create_deal(deal_details: DealCreate, background_tasks: BackgroundTasks):
+    deal = await deal_service.create_deal(
+        fund_manager_id=deal_details.fund_manager_id,
+        title=deal_details.title,
+        description=deal_details.description,
+        amount=deal_details.amount,
+        legal_document_url=deal_details.legal_document_id
+    )
+    if deal.status == DealStatus.OPEN:
+        background_tasks.add_task(announcement_service.announce_deal, deal.id, deal.fund_manager_id, deal.title)
+    return DealOut(**deal.model_dump())
+
+@router.patch('/{deal_id}', response_model=DealOut)
+async def update_deal(deal_id: uuid.UUID, deal_details: DealUpdate, background_tasks: BackgroundTasks):
+    changes = deal_details.model_dump(exclude_unset=True)
+    if "legal_document_id" in changes:
+        changes["legal_document_url"] = changes.pop("legal_document_id")
+
+    deal = await deal_service.update_deal(deal_id, changes)
+    if changes.get("status") == DealStatus.OPEN:
+        # no-op if this deal's announcement is already running or done
+        background_tasks.add_task(announcement_service.announce_deal, deal.id, deal.fund_manager_id, deal.title)
+    return DealOut(**deal.model_dump())
+
+@router.get('/{deal_id}/allocation/preview', response_model=AllocationResult)
+async def preview_allocation(
+    deal_id: uuid.UUID,
+    min_ticket: float = Query(default=0.0, ge=0),
+    capacity: Optional[float] = Query(default=None, gt=0),
+):
+    # what-if simulation: nothing is written
+    summary = await allocation_service.allocate_deal(deal_id, min_ticket=min_ticket, capacity=capacity, dry_run=True)
+    return AllocationResult(**summary)
+
+@router.post('/{deal_id}/allocation', response_model=AllocationResult)
+async def allocate_deal(deal_id: uuid.UUID, allocation_details: AllocationRequest):
+    summary = await allocation_service.allocate_deal(
+        deal_id,
+        min_ticket=allocation_details.min_ticket,
+        capacity=allocation_details.capacity,
+        dry_run=allocation_details.dry_run,
+    )
+    return AllocationResult(**summary)
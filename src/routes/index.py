@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
 router = APIRouter() 
@@ -18,4 +18,13 @@ router = APIRouter()
 @router.get('/health')
 def health():
     content = {"isSuccess": "ok", "message": "router setup done."}
-    return JSONResponse(status_code=200, content=content) 
\ No newline at end of file
+    return JSONResponse(status_code=200, content=content)
+
+@router.get('/stats/event-loop')
+def event_loop_stats(request: Request):
+    loop_monitor = request.app.state.loop_monitor
+    if loop_monitor is None:
+        content = {"isSuccess": "ok", "message": "event loop monitor disabled (LOOP_MONITOR_ENABLED)."}
+        return JSONResponse(status_code=200, content=content)
+    content = {"isSuccess": "ok", "data": loop_monitor.snapshot()}
+    return JSONResponse(status_code=200, content=content)
@@ -0,0 +1,21 @@
+import uuid
+from fastapi import APIRouter, HTTPException, Request
+from schemas.investment import InvestmentOut
+from services.investment_service import InvestmentService
+from utils.etag import conditional_json, make_etag
+from db.db_connection import db_services
+
+investment_service = InvestmentService(db_services=db_services)
+
+router = APIRouter()
+
+@router.get('/{investment_id}', response_model=InvestmentOut)
+async def get_investment(investment_id: uuid.UUID, request: Request):
+    version = await investment_service.get_investment_version(investment_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Investment not found")
+
+    async def build():
+        return InvestmentOut(**(await investment_service.get_investment(investment_id)).model_dump())
+
+    return await conditional_json(request, make_etag(*version), ("investment", investment_id), build)
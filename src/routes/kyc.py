@@ -1,4 +1,5 @@
 from fastapi import APIRouter 
+from fastapi.responses import JSONResponse
 from schemas.kyc import ( AadhaarRequest, AadhaarResponse,
                          SubmitOTPRequest, SubmitOTPResponse,
                          ResendOTPRequest, ResendOTPResponse,
@@ -12,20 +13,32 @@ from schemas.kyc import ( AadhaarRequest, AadhaarResponse,
 from services.aadhaar_service import AadhaarService
 from services.pan_service import PANService
 from services.phone_service import PhoneService
+from services.audit_service import AuditService
+from models.audit import KycEventType
+from db.db_connection import db_services
+from schemas.validators import rejection_counts
 
 
 aadhaar_service = AadhaarService() #initiate the service to use later in code. 
 pan_service = PANService()  # initiate PAN service
 phone_service = PhoneService() # initiate Phone service
+audit_service = AuditService(db_services=db_services) # buffered KYC audit trail, started/stopped in lifespan
 
 router = APIRouter() 
 
+@router.get('/validation/stats')
+def validation_stats():
+    # malformed inputs rejected before reaching Digitap / Plivo
+    content = {"isSuccess": "ok", "data": {"vendor_calls_avoided": rejection_counts()}}
+    return JSONResponse(status_code=200, content=content)
+
 @router.post('/verify-aadhaar')
 async def verify_aadhaar(aadhaar_details: AadhaarRequest) -> AadhaarResponse:
-    response_data = await aadhaar_service.initiate_kyc(
-        unique_id=aadhaar_details.unique_id,
-        aadhaar_number=aadhaar_details.aadhaar_number
-    )
+    async with audit_service.track(KycEventType.AADHAAR_OTP_SENT, subject_ref=aadhaar_details.unique_id):
+        response_data = await aadhaar_service.initiate_kyc(
+            unique_id=aadhaar_details.unique_id,
+            aadhaar_number=aadhaar_details.aadhaar_number
+        )
 
     return AadhaarResponse(
         transaction_id=response_data["transaction_id"],
@@ -36,53 +49,59 @@ async def verify_aadhaar(aadhaar_details: AadhaarRequest) -> AadhaarResponse:
 
 @router.post('/submit-aadhaar-otp')
 async def submit_aadhaar_otp(otp_details: SubmitOTPRequest) -> SubmitOTPResponse:
-    user_data = await aadhaar_service.submit_aadhaar_otp(
-        otp=otp_details.otp,
-        transaction_id=otp_details.transaction_id,
-        code_verifier=otp_details.code_verifier,
-        fwdp=otp_details.fwdp
-    )
+    async with audit_service.track(KycEventType.AADHAAR_OTP_SUBMITTED, subject_ref=otp_details.transaction_id):
+        user_data = await aadhaar_service.submit_aadhaar_otp(
+            otp=otp_details.otp,
+            transaction_id=otp_details.transaction_id,
+            code_verifier=otp_details.code_verifier,
+            fwdp=otp_details.fwdp
+        )
 
     return SubmitOTPResponse(**user_data) 
 
 @router.post('/resend-aadhaar-otp')
 async def resend_aadhaar_otp(otp_details: ResendOTPRequest) -> ResendOTPResponse:
-    response_data = await aadhaar_service.resend_aadhaar_otp(
-        unique_id=otp_details.unique_id,
-        aadhaar_number=otp_details.aadhaar_number,
-        transaction_id=otp_details.transaction_id,
-        fwdp=otp_details.fwdp
-    )
+    async with audit_service.track(KycEventType.AADHAAR_OTP_RESENT, subject_ref=otp_details.unique_id):
+        response_data = await aadhaar_service.resend_aadhaar_otp(
+            unique_id=otp_details.unique_id,
+            aadhaar_number=otp_details.aadhaar_number,
+            transaction_id=otp_details.transaction_id,
+            fwdp=otp_details.fwdp
+        )
 
     return ResendOTPResponse(**response_data)
 
 @router.post('/verify-pan')
 async def verify_pan(pan_details: PanDetailsRequest) -> PanDetailsResponse:
-    pan_data = await pan_service.verify_pan(
-        unique_id=pan_details.unique_id,
-        pan_number=pan_details.pan_number
-    )
+    async with audit_service.track(KycEventType.PAN_VERIFIED, subject_ref=pan_details.unique_id):
+        pan_data = await pan_service.verify_pan(
+            unique_id=pan_details.unique_id,
+            pan_number=pan_details.pan_number
+        )
 
     return PanDetailsResponse(**pan_data)
 
 @router.post('/verify-phone-number', response_model=PhoneNumResponse)
 async def verify_phone_number(onboarding_details: PhoneNumRequest):
-    
-    result = await phone_service.verify_phone_number(
-        phone_number=onboarding_details.phone_number,
-        alias=onboarding_details.alias,
-        channel=onboarding_details.channel
-    )
+    masked_phone = f"{'*' * max(len(onboarding_details.phone_number) - 4, 0)}{onboarding_details.phone_number[-4:]}"
+
+    async with audit_service.track(KycEventType.PHONE_VERIFICATION_SENT, subject_ref=masked_phone):
+        result = await phone_service.verify_phone_number(
+            phone_number=onboarding_details.phone_number,
+            alias=onboarding_details.alias,
+            channel=onboarding_details.channel
+        )
     return PhoneNumResponse(**result)
 
 @router.post('/verify-otp', response_model=OTPVerificationResponse)
 async def verify_otp(request: OTPVerificationRequest):
     phone_service = PhoneService()
     
-    result = await phone_service.verify_otp(
-        session_uuid=request.session_uuid,
-        otp_code=request.otp_code
-    )
+    async with audit_service.track(KycEventType.PHONE_OTP_VERIFIED, subject_ref=request.session_uuid):
+        result = await phone_service.verify_otp(
+            session_uuid=request.session_uuid,
+            otp_code=request.otp_code
+        )
 
     return OTPVerificationResponse(
         message=result.get("message", "OTP verified successfully."),
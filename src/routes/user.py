@@ -0,0 +1,51 @@
+import uuid
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
+from schemas.investment import InvestmentOut, PortfolioOut
+from schemas.user import UserUpdate, UserProfile, InvitationCodeResponse
+from services.investment_service import InvestmentService
+from services.user_service import UserService
+from utils.etag import conditional_json, make_collection_etag, make_etag, response_cache
+from db.db_connection import db_services
+
+user_service = UserService(db_services=db_services) # cached user lookups
+investment_service = InvestmentService(db_services=db_services)
+
+router = APIRouter()
+
+@router.get('/cache/stats')
+def user_cache_stats():
+    content = {"isSuccess": "ok", "data": {**user_service.cache_stats(), "responses": response_cache.stats()}}
+    return JSONResponse(status_code=200, content=content)
+
+@router.get('/invitation/{invitation_code}', response_model=InvitationCodeResponse)
+async def check_invitation_code(invitation_code: str):
+    user = await user_service.get_user_by_invitation_code(invitation_code)
+    return InvitationCodeResponse(invitation_code=invitation_code, valid=user is not None)
+
+@router.get('/{user_id}', response_model=UserProfile)
+async def get_user(user_id: uuid.UUID, request: Request):
+    user = await user_service.get_user_by_id(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    async def build():
+        return UserProfile(**user.model_dump())
+
+    return await conditional_json(request, make_etag(user.id, user.updated_at, user.created_at), ("user", user_id), build)
+
+@router.get('/{user_id}/investments', response_model=PortfolioOut)
+async def get_portfolio(user_id: uuid.UUID, request: Request):
+    versions = await investment_service.get_portfolio_versions(user_id)
+
+    async def build():
+        investments = await investment_service.get_portfolio(user_id)
+        return PortfolioOut(investor_id=user_id, investments=[InvestmentOut(**i.model_dump()) for i in investments])
+
+    etag = make_collection_etag(f"portfolio:{user_id}", versions)
+    return await conditional_json(request, etag, ("portfolio", user_id), build)
+
+@router.patch('/{user_id}', response_model=UserProfile)
+async def update_user(user_id: uuid.UUID, user_details: UserUpdate):
+    user = await user_service.update_user(user_id, user_details.model_dump(exclude_unset=True))
+    return UserProfile(**user.model_dump())
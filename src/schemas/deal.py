@@ -1,19 +1,51 @@
-from pydantic import BaseModel
-from typing import Optional
-import datetime
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
+from datetime import datetime
+import uuid
+from models.deal import DealStatus
 # from .models import Role
 
 class DealCreate(BaseModel):
+    fund_manager_id: int
     title: str
     description: str
     amount: float
-    legal_document_id: Optional[str]
+    legal_document_id: Optional[str] = None
+
+class DealUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    amount: Optional[float] = None
+    status: Optional[DealStatus] = None
+    legal_document_id: Optional[str] = None
 
 class DealOut(BaseModel):
-    id: int
+    id: uuid.UUID
     fund_manager_id: int
     title: str
     description: str
     amount: float
     status: str
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class DealSearchHit(DealOut):
+    score: float
+
+class DealSearchResponse(BaseModel):
+    query: str
+    results: List[DealSearchHit]
+
+class AllocationRequest(BaseModel):
+    min_ticket: float = Field(default=0.0, ge=0)
+    capacity: Optional[float] = Field(default=None, gt=0)  # what-if override of the deal amount
+    dry_run: bool = False
+
+class AllocationResult(BaseModel):
+    deal_id: uuid.UUID
+    capacity: float
+    committed: float
+    allocated: float
+    oversubscribed: bool
+    dropped: int
+    allocations: Dict[str, float]  # investment id -> allocated amount
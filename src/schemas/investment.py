@@ -1,16 +1,25 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Optional, List
+from datetime import datetime
+import uuid
 # from .models import Role
 
 class InvestmentCreate(BaseModel):
-    deal_id: int
+    deal_id: uuid.UUID
     amount: float
     payment_method: str  # e.g., "credit_card", "upi", "net_banking"
 
 class InvestmentOut(BaseModel):
-    id: int
-    investor_id: int
-    deal_id: int
+    id: uuid.UUID
+    investor_id: uuid.UUID
+    deal_id: uuid.UUID
     amount: float
+    allocated_amount: Optional[float] = None
     payment_status: str
-    signed_document_id: Optional[str]
\ No newline at end of file
+    signed_document_url: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class PortfolioOut(BaseModel):
+    investor_id: uuid.UUID
+    investments: List[InvestmentOut]
@@ -1,9 +1,10 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional, Dict
+from schemas.validators import AadhaarNumber, PanNumber, PhoneNumber
 
 class AadhaarRequest(BaseModel):
     unique_id: str
-    aadhaar_number: str
+    aadhaar_number: AadhaarNumber
 
 class AadhaarResponse(BaseModel):
     transaction_id: str
@@ -34,7 +35,7 @@ class SubmitOTPResponse(BaseModel):
 
 class ResendOTPRequest(BaseModel):
     unique_id: str
-    aadhaar_number: str
+    aadhaar_number: AadhaarNumber
     transaction_id: str
     fwdp: str
 
@@ -46,7 +47,7 @@ class ResendOTPResponse(BaseModel):
 
 class PanDetailsRequest(BaseModel):
     unique_id: str
-    pan_number: str
+    pan_number: PanNumber
 
 class PanDetailsResponse(BaseModel):
     pan: str
@@ -57,7 +58,7 @@ class PanDetailsResponse(BaseModel):
     seeding_status: Optional[str] = None
 
 class PhoneNumRequest(BaseModel):
-    phone_number: str
+    phone_number: PhoneNumber
     alias: Optional[str] = "UserVerification"
     channel: Optional[str] = "sms"
 
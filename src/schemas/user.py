@@ -1,7 +1,8 @@
 from pydantic import BaseModel, EmailStr
 from typing import Optional
-from ..models.user import Role
+from models.user import Role, KycStatus
 from datetime import datetime
+import uuid
 
 class UserBase(BaseModel):
     email: Optional[EmailStr] = None
@@ -23,4 +24,27 @@ class UserLogin(BaseModel):
     phone_number: Optional[str] = None
     password: str
 
-    
\ No newline at end of file
+class UserUpdate(BaseModel):
+    email: Optional[EmailStr] = None
+    phone_number: Optional[str] = None
+    occupation: Optional[str] = None
+    income_source: Optional[float] = None
+    annual_income: Optional[float] = None
+    capital_commitment: Optional[float] = None
+    profile_image_url: Optional[str] = None
+
+class UserProfile(BaseModel):
+    id: uuid.UUID
+    email: Optional[str] = None
+    phone_number: Optional[str] = None
+    role: Role
+    occupation: Optional[str] = None
+    kyc_status: KycStatus
+    fund_manager_id: Optional[int] = None
+    profile_image_url: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+class InvitationCodeResponse(BaseModel):
+    invitation_code: str
+    valid: bool
@@ -0,0 +1,106 @@
+import re
+import threading
+from collections import Counter
+from typing import Annotated
+from pydantic import AfterValidator
+
+# Verhoeff dihedral-group tables used by UIDAI for the Aadhaar check digit.
+VERHOEFF_D = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+    (1, 2, 3, 4, 0, 6, 7, 8, 9, 5),
+    (2, 3, 4, 0, 1, 7, 8, 9, 5, 6),
+    (3, 4, 0, 1, 2, 8, 9, 5, 6, 7),
+    (4, 0, 1, 2, 3, 9, 5, 6, 7, 8),
+    (5, 9, 8, 7, 6, 0, 4, 3, 2, 1),
+    (6, 5, 9, 8, 7, 1, 0, 4, 3, 2),
+    (7, 6, 5, 9, 8, 2, 1, 0, 4, 3),
+    (8, 7, 6, 5, 9, 3, 2, 1, 0, 4),
+    (9, 8, 7, 6, 5, 4, 3, 2, 1, 0),
+)
+VERHOEFF_P = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+    (1, 5, 7, 6, 2, 8, 3, 0, 9, 4),
+    (5, 8, 0, 3, 7, 9, 6, 1, 4, 2),
+    (8, 9, 1, 6, 0, 4, 3, 5, 2, 7),
+    (9, 4, 5, 3, 1, 2, 6, 8, 7, 0),
+    (4, 2, 8, 6, 5, 7, 3, 9, 0, 1),
+    (2, 7, 9, 3, 8, 0, 6, 4, 1, 5),
+    (7, 0, 4, 6, 9, 1, 3, 2, 5, 8),
+)
+
+SEPARATORS = re.compile(r"[\s\-().]")
+AADHAAR_PATTERN = re.compile(r"[2-9][0-9]{11}")  # UIDAI never issues numbers starting with 0 or 1
+# 4th character is the holder type: Person, Company, HUF, Firm, AOP, Trust, BOI, Local authority, Artificial juridical person, Government
+PAN_PATTERN = re.compile(r"[A-Z]{3}[PCHFATBLJG][A-Z][0-9]{4}[A-Z]")
+E164_PATTERN = re.compile(r"\+[1-9][0-9]{7,14}")
+INDIAN_MOBILE_PATTERN = re.compile(r"[6-9][0-9]{9}")
+DEFAULT_COUNTRY_CODE = "91"
+
+_rejections: Counter = Counter()
+_rejections_lock = threading.Lock()
+
+def _reject(kind: str, message: str):
+    with _rejections_lock:
+        _rejections[kind] += 1
+    raise ValueError(message)
+
+def rejection_counts() -> dict:
+    """
+    Inputs rejected locally per field type, i.e. vendor calls that were never made.
+    """
+    with _rejections_lock:
+        return dict(_rejections)
+
+def verhoeff_valid(digits: str) -> bool:
+    checksum = 0
+    for position, digit in enumerate(reversed(digits)):
+        checksum = VERHOEFF_D[checksum][VERHOEFF_P[position % 8][ord(digit) - 48]]
+    return checksum == 0
+
+def normalize_aadhaar(value: str) -> str:
+    """
+    Canonical 12-digit Aadhaar number; spaces and hyphens are stripped.
+    """
+    digits = SEPARATORS.sub("", value)
+    if not AADHAAR_PATTERN.fullmatch(digits):
+        _reject("aadhaar", "Aadhaar number must be 12 digits and cannot start with 0 or 1")
+    if not verhoeff_valid(digits):
+        _reject("aadhaar", "Invalid Aadhaar number")
+    return digits
+
+def normalize_pan(value: str) -> str:
+    """
+    Canonical upper-case PAN, e.g. ABCPE1234F.
+    """
+    pan = SEPARATORS.sub("", value).upper()
+    if not PAN_PATTERN.fullmatch(pan):
+        _reject("pan", "Invalid PAN format")
+    return pan
+
+def normalize_phone(value: str) -> str:
+    """
+    E.164 phone number. Bare 10-digit numbers and numbers with a trunk `0` or `91` prefix are
+    treated as Indian mobiles.
+    """
+    number = SEPARATORS.sub("", value)
+    if number.startswith("00"):
+        number = "+" + number[2:]
+
+    if not number.startswith("+"):
+        if len(number) == 11 and number.startswith("0"):
+            number = number[1:]
+        elif len(number) == 12 and number.startswith(DEFAULT_COUNTRY_CODE):
+            number = number[2:]
+        if not INDIAN_MOBILE_PATTERN.fullmatch(number):
+            _reject("phone_number", "Invalid mobile number")
+        number = f"+{DEFAULT_COUNTRY_CODE}{number}"
+
+    if not E164_PATTERN.fullmatch(number):
+        _reject("phone_number", "Phone number must be in E.164 format")
+    if number.startswith("+" + DEFAULT_COUNTRY_CODE) and not INDIAN_MOBILE_PATTERN.fullmatch(number[3:]):
+        _reject("phone_number", "Invalid Indian mobile number")
+    return number
+
+AadhaarNumber = Annotated[str, AfterValidator(normalize_aadhaar)]
+PanNumber = Annotated[str, AfterValidator(normalize_pan)]
+PhoneNumber = Annotated[str, AfterValidator(normalize_phone)]
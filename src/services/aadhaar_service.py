@@ -1,6 +1,7 @@
 import httpx
 import base64
 from fastapi import HTTPException
+from utils.tracing import traced, TracingTransport
 
 DIGITAP_BASE_URL = "https://svcdemo.digitap.work"
 CLIENT_ID = "your_client_id"
@@ -20,6 +21,7 @@ class AadhaarService:
             "Content-Type": "application/json"
         }
 
+    @traced()
     async def initiate_kyc(self, unique_id: str, aadhaar_number: str) -> dict:
         url = f"{self.base_url}/ent/v3/kyc/intiate-kyc-auto"
         payload = {
@@ -28,7 +30,7 @@ class AadhaarService:
         }
         headers = self.get_auth_header()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=TracingTransport()) as client:
             response = await client.post(url, json=payload, headers=headers)
 
         if response.status_code != 200:
@@ -42,6 +44,7 @@ class AadhaarService:
             "code_verifier": data["model"]["codeVerifier"]
         }
 
+    @traced()
     async def submit_aadhaar_otp(self, otp: str, transaction_id: str, code_verifier: str, fwdp: str, share_code: str = "5678") -> dict:
         url = f"{self.base_url}/ent/v3/kyc/submit-otp"
         payload = {
@@ -54,7 +57,7 @@ class AadhaarService:
         }
         headers = self.get_auth_header()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=TracingTransport()) as client:
             response = await client.post(url, json=payload, headers=headers)
 
         if response.status_code != 200:
@@ -69,6 +72,7 @@ class AadhaarService:
 
         return user_data
     
+    @traced()
     async def resend_aadhaar_otp(self, unique_id: str, aadhaar_number: str, transaction_id: str, fwdp: str) -> dict:
         url = f"{self.base_url}/ent/v3/kyc/resend-otp"
         payload = {
@@ -79,7 +83,7 @@ class AadhaarService:
         }
         headers = self.get_auth_header()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=TracingTransport()) as client:
             response = await client.post(url, json=payload, headers=headers)
 
         if response.status_code != 200:
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import inspect, select, text, update
+from logging.logging_setup import get_logger
+from models.deal import Deal
+from models.investment import Investment, PaymentStatus
+from services.db_services import DatabaseServices
+from utils.allocation import allocate_pro_rata, to_units
+from utils.etag import response_cache
+from utils.tracing import traced
+
+ALLOCATION_UNIT = 0.01  # allocate in paise
+DEFAULT_MIN_TICKET = 0.0
+
+class AllocationService:
+    """
+    Scales back oversubscribed deals. Commitments are loaded into NumPy arrays, allocated in
+    one vectorized pass (see `utils.allocation.allocate_pro_rata`) and written back with a
+    single bulk UPDATE keyed by investment id.
+    """
+
+    def __init__(self, db_services: DatabaseServices, unit: float = ALLOCATION_UNIT):
+        self.db_services = db_services
+        self.unit = unit
+        self.logger = get_logger("AllocationService", env="dev")
+
+    def ensure_schema(self) -> None:
+        """
+        Add `Investment.allocated_amount` to databases created before the column existed;
+        `create_all` only creates missing tables and never alters existing ones.
+        """
+        engine = self.db_services.engine
+        table = Investment.__tablename__
+        inspector = inspect(engine)
+        if not inspector.has_table(table):
+            return
+        if "allocated_amount" not in {column["name"] for column in inspector.get_columns(table)}:
+            with engine.begin() as connection:
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN allocated_amount FLOAT"))
+            self.logger.info(f"Added allocated_amount column to {table}")
+
+    @traced()
+    async def allocate_deal(
+        self,
+        deal_id,
+        min_ticket: float = DEFAULT_MIN_TICKET,
+        capacity: Optional[float] = None,
+        dry_run: bool = False,
+    ) -> dict:
+        """
+        Allocate a deal pro-rata and, unless `dry_run`, persist `Investment.allocated_amount`.
+        :param deal_id: deal to allocate
+        :param min_ticket: smallest allocation in rupees; smaller pro-rata shares are dropped
+        :param capacity: override `Deal.amount` for what-if simulations
+        :param dry_run: compute without writing
+        :return: summary with per-investment allocations
+        """
+        return await asyncio.to_thread(self._allocate_deal, deal_id, min_ticket, capacity, dry_run)
+
+    def _allocate_deal(self, deal_id, min_ticket: float, capacity: Optional[float], dry_run: bool) -> dict:
+        with self.db_services.SessionLocal() as session:
+            deal_amount = session.scalar(select(Deal.amount).where(Deal.id == deal_id))
+            if deal_amount is None:
+                raise HTTPException(status_code=404, detail="Deal not found")
+
+            rows = session.execute(
+                select(Investment.id, Investment.amount)
+                .where(Investment.deal_id == deal_id, Investment.payment_status != PaymentStatus.FAILED)
+                .order_by(Investment.created_at, Investment.id)
+            ).all()
+
+            investment_ids = [row[0] for row in rows]
+            commitments = to_units([row[1] for row in rows], self.unit)
+            target = to_units(capacity if capacity is not None else deal_amount, self.unit).item()
+            allocations = allocate_pro_rata(commitments, target, to_units(min_ticket, self.unit).item())
+            allocated_amounts = (allocations * self.unit).round(2).tolist()
+
+            if not dry_run and investment_ids:
+                # updated_at moves the investments' ETags along with the new allocations
+                allocated_at = datetime.now(timezone.utc)
+                session.execute(
+                    update(Investment),
+                    [
+                        {"id": investment_id, "allocated_amount": amount, "updated_at": allocated_at}
+                        for investment_id, amount in zip(investment_ids, allocated_amounts)
+                    ],
+                )
+                session.commit()
+                response_cache.invalidate_kind("investment")
+                response_cache.invalidate_kind("portfolio")
+
+        summary = {
+            "deal_id": str(deal_id),
+            "capacity": target * self.unit,
+            "committed": float(commitments.sum()) * self.unit,
+            "allocated": float(allocations.sum()) * self.unit,
+            "oversubscribed": bool(commitments.sum() > target),
+            "dropped": int(np.count_nonzero((allocations == 0) & (commitments > 0))),
+            "allocations": dict(zip(map(str, investment_ids), allocated_amounts)),
+        }
+        self.logger.info(
+            f"Allocated deal {deal_id}: committed={summary['committed']:.2f} allocated={summary['allocated']:.2f} dry_run={dry_run}"
+        )
+        return summary
@@ -0,0 +1,272 @@
+import asyncio
+import json
+import os
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+from logging.logging_setup import get_logger
+from models.audit import KycAuditEvent, KycEventType, AuditOutcome
+from services.db_services import DatabaseServices
+
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL_S = 2.0
+AUDIT_MAX_BUFFER = 10_000
+AUDIT_ENQUEUE_TIMEOUT_S = 5.0
+AUDIT_SPILL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs", "kyc-audit-spill")
+
+class AuditService:
+    """
+    Write-behind buffer for KYC audit events.
+
+    Events are appended to a local spill segment and kept in memory until a background
+    task writes them to the audit table in bulk INSERTs, either when `batch_size`
+    events are pending or every `flush_interval` seconds. A segment holds up to
+    `batch_size` events and is deleted once all of them are committed, so spill I/O is
+    one append per event plus one unlink per segment, all off the event loop. Segments
+    left over after a crash are replayed into the table (deduplicated by event id) on
+    the next `start()`.
+    """
+
+    def __init__(
+        self,
+        db_services: DatabaseServices,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_S,
+        max_buffer: int = AUDIT_MAX_BUFFER,
+        enqueue_timeout: float = AUDIT_ENQUEUE_TIMEOUT_S,
+        spill_dir: str = AUDIT_SPILL_DIR,
+    ):
+        self.db_services = db_services
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.enqueue_timeout = enqueue_timeout
+        self.spill_dir = spill_dir
+        self.logger = get_logger("AuditService", env="dev")
+
+        self._buffer: deque[dict] = deque()
+        self._not_full = asyncio.Condition()
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+
+        self._segment = 0  # segment new events are appended to
+        self._segment_size = 0
+        self._segment_pending: dict[int, int] = {}  # segment -> events not yet committed
+        self._reserved = 0  # slots taken by records whose spill append is in flight
+
+    async def start(self) -> None:
+        """
+        Create the audit table if needed, replay leftovers from the spill file and start the flusher.
+        """
+        await asyncio.to_thread(KycAuditEvent.__table__.create, self.db_services.engine, checkfirst=True)
+        await asyncio.to_thread(self._replay_spill)
+        self._closing = False
+        self._flusher = asyncio.create_task(self._run(), name="kyc-audit-flusher")
+
+    async def stop(self) -> None:
+        """
+        Stop the flusher and write out everything still buffered. Events that cannot be
+        written stay in the spill segments for the next start.
+        """
+        self._closing = True
+        if self._flusher is not None:
+            self._flush_requested.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush()
+        if self._buffer:
+            self.logger.error(f"{len(self._buffer)} audit events left unflushed in {self.spill_dir}")
+
+    async def record(
+        self,
+        event_type: KycEventType,
+        subject_ref: str,
+        outcome: AuditOutcome,
+        status_code: Optional[int] = None,
+        detail: Optional[str] = None,
+    ) -> None:
+        """
+        Buffer one audit event. Waits while the buffer is full and raises 503 if no space
+        frees up within `enqueue_timeout`, so KYC calls cannot outrun the audit trail.
+        """
+        event = {
+            "id": uuid.uuid4(),
+            "event_type": event_type,
+            "subject_ref": subject_ref,
+            "outcome": outcome,
+            "status_code": status_code,
+            "detail": detail,
+            "created_at": datetime.now(timezone.utc),
+        }
+
+        async with self._not_full:
+            try:
+                await asyncio.wait_for(
+                    self._not_full.wait_for(lambda: len(self._buffer) + self._reserved < self.max_buffer),
+                    timeout=self.enqueue_timeout,
+                )
+            except TimeoutError:
+                self.logger.error("Audit buffer full, rejecting KYC request")
+                raise HTTPException(status_code=503, detail="Audit log unavailable, please retry")
+
+            # Reserve a buffer slot and count the event against its segment, so a concurrent
+            # flush cannot delete the segment while the append below is in flight.
+            self._reserved += 1
+            segment = self._segment
+            self._segment_size += 1
+            self._segment_pending[segment] = self._segment_pending.get(segment, 0) + 1
+            if self._segment_size >= self.batch_size:
+                self._segment, self._segment_size = self._segment + 1, 0
+
+        # The spill append runs without the condition lock, so concurrent records and the
+        # flusher's notify do not queue behind each other's file I/O.
+        try:
+            await asyncio.to_thread(self._append_spill, segment, event)
+        except BaseException:
+            self._reserved -= 1
+            self._release_segments([segment])
+            async with self._not_full:
+                self._not_full.notify_all()
+            raise
+        event["_segment"] = segment
+        self._reserved -= 1
+        self._buffer.append(event)
+
+        if len(self._buffer) >= self.batch_size:
+            self._flush_requested.set()
+
+    @asynccontextmanager
+    async def track(self, event_type: KycEventType, subject_ref: str):
+        """
+        Record the outcome of the wrapped vendor call as a success or failure event.
+        """
+        try:
+            yield
+        except HTTPException as exc:
+            await self.record(event_type, subject_ref, AuditOutcome.FAILURE, status_code=exc.status_code, detail=str(exc.detail))
+            raise
+        except Exception as exc:
+            await self.record(event_type, subject_ref, AuditOutcome.FAILURE, status_code=500, detail=repr(exc))
+            raise
+        else:
+            await self.record(event_type, subject_ref, AuditOutcome.SUCCESS, status_code=200)
+
+    async def flush(self) -> int:
+        """
+        Write buffered events to the audit table in batches. Returns the number of events written.
+        """
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                try:
+                    await asyncio.to_thread(self._insert_batch, batch)
+                except Exception as exc:
+                    self.logger.error(f"Failed to flush {len(batch)} audit events: {exc}")
+                    self._buffer.extendleft(reversed(batch))
+                    break
+
+                written += len(batch)
+                done = self._release_segments(event["_segment"] for event in batch)
+                if done:
+                    await asyncio.to_thread(self._remove_segments, done)
+                async with self._not_full:
+                    self._not_full.notify_all()
+
+        return written
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    def _insert_batch(self, batch: list[dict]) -> None:
+        rows = [{key: value for key, value in event.items() if key != "_segment"} for event in batch]
+        with self.db_services.SessionLocal() as session:
+            session.execute(insert(KycAuditEvent), rows)
+            session.commit()
+
+    def _release_segments(self, segments) -> list[int]:
+        """
+        Mark events as committed; return the segments that have nothing left to commit.
+        """
+        done = []
+        for segment in segments:
+            self._segment_pending[segment] -= 1
+            if self._segment_pending[segment] == 0:
+                del self._segment_pending[segment]
+                done.append(segment)
+        if self._segment in done:
+            # the open segment is fully committed; start a fresh one so it can be removed
+            self._segment, self._segment_size = self._segment + 1, 0
+        return done
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.spill_dir, f"{segment:012d}.jsonl")
+
+    def _append_spill(self, segment: int, event: dict) -> None:
+        with open(self._segment_path(segment), "a", encoding="utf-8") as spill:
+            spill.write(self._serialize(event))
+
+    def _remove_segments(self, segments: list[int]) -> None:
+        for segment in segments:
+            try:
+                os.remove(self._segment_path(segment))
+            except FileNotFoundError:
+                pass
+
+    def _replay_spill(self) -> None:
+        os.makedirs(self.spill_dir, exist_ok=True)
+        paths = sorted(
+            os.path.join(self.spill_dir, name) for name in os.listdir(self.spill_dir) if name.endswith(".jsonl")
+        )
+        events = []
+        for path in paths:
+            with open(path, encoding="utf-8") as spill:
+                events.extend(self._deserialize(line) for line in spill if line.strip())
+        if not events:
+            for path in paths:
+                os.remove(path)
+            return
+
+        # A crash between commit and spill rewrite leaves already-written events behind.
+        with self.db_services.SessionLocal() as session:
+            ids = [event["id"] for event in events]
+            existing = set(session.scalars(select(KycAuditEvent.id).where(KycAuditEvent.id.in_(ids))))
+            pending = [event for event in events if event["id"] not in existing]
+            for start in range(0, len(pending), self.batch_size):
+                session.execute(insert(KycAuditEvent), pending[start:start + self.batch_size])
+            session.commit()
+
+        for path in paths:
+            os.remove(path)
+        self.logger.info(f"Replayed {len(pending)} audit events from {len(paths)} spill segment(s)")
+
+    @staticmethod
+    def _serialize(event: dict) -> str:
+        return json.dumps({
+            **{key: value for key, value in event.items() if key != "_segment"},
+            "id": str(event["id"]),
+            "event_type": event["event_type"].value,
+            "outcome": event["outcome"].value,
+            "created_at": event["created_at"].isoformat(),
+        }) + "\n"
+
+    @staticmethod
+    def _deserialize(line: str) -> dict:
+        event = json.loads(line)
+        event["id"] = uuid.UUID(event["id"])
+        event["event_type"] = KycEventType(event["event_type"])
+        event["outcome"] = AuditOutcome(event["outcome"])
+        event["created_at"] = datetime.fromisoformat(event["created_at"])
+        return event
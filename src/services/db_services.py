@@ -3,11 +3,13 @@ from sqlalchemy.orm import sessionmaker
 from typing import Generator
 import os
 from logging.logging_setup import get_logger
+from utils.tracing import instrument_engine
 
 class DatabaseServices:
     def __init__(self, db_url: str = "sqlite:///./test.db"):
         self.db_url = db_url
         self.engine = create_engine(self.db_url, echo=True, connect_args={"check_same_thread": False})
+        instrument_engine(self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine, class_=Session)
         self.logger = get_logger("DatabaseServices", env="dev")
 
@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import HTTPException
+from sqlmodel import select
+from logging.logging_setup import get_logger
+from models.deal import Deal, DealStatus
+from services.db_services import DatabaseServices
+from services.search_service import DealSearchBackend, get_deal_search_backend
+from utils.etag import response_cache
+from utils.tracing import traced
+
+class DealService:
+    """
+    Deal writes go through here so the full-text index stays in step with the deal table.
+    """
+
+    def __init__(self, db_services: DatabaseServices, search_backend: Optional[DealSearchBackend] = None):
+        self.db_services = db_services
+        self.search_backend = search_backend or get_deal_search_backend(db_services.engine)
+        self.logger = get_logger("DealService", env="dev")
+
+    def init_search_index(self) -> None:
+        self.search_backend.ensure_index(self.db_services.engine)
+
+    @traced()
+    async def create_deal(self, fund_manager_id: int, title: str, description: str, amount: float,
+                          legal_document_url: Optional[str] = None) -> Deal:
+        return await asyncio.to_thread(self._create_deal, fund_manager_id, title, description, amount, legal_document_url)
+
+    @traced()
+    async def update_deal(self, deal_id, changes: dict) -> Deal:
+        return await asyncio.to_thread(self._update_deal, deal_id, changes)
+
+    @traced()
+    async def get_deal_version(self, deal_id) -> Optional[tuple]:
+        """
+        (id, updated_at, created_at) for a deal, enough to build its ETag without loading the row.
+        """
+        return await asyncio.to_thread(self._get_deal_version, deal_id)
+
+    @traced()
+    async def get_deal(self, deal_id) -> Deal:
+        return await asyncio.to_thread(self._get_deal, deal_id)
+
+    @traced()
+    async def search_deals(self, query: str, status: Optional[DealStatus] = None, fund_manager_id: Optional[int] = None,
+                           limit: int = 20, offset: int = 0) -> list[tuple[Deal, float]]:
+        return await asyncio.to_thread(self._search_deals, query, status, fund_manager_id, limit, offset)
+
+    def _create_deal(self, fund_manager_id, title, description, amount, legal_document_url) -> Deal:
+        with self.db_services.SessionLocal() as session:
+            deal = Deal(
+                fund_manager_id=fund_manager_id,
+                title=title,
+                description=description,
+                amount=amount,
+                legal_document_url=legal_document_url,
+            )
+            session.add(deal)
+            self.search_backend.index_deal(session, deal)
+            session.commit()
+            session.refresh(deal)
+            self.logger.info(f"Deal {deal.id} created by fund manager {fund_manager_id}")
+            return deal
+
+    def _update_deal(self, deal_id, changes: dict) -> Deal:
+        with self.db_services.SessionLocal() as session:
+            deal = session.get(Deal, deal_id)
+            if deal is None:
+                raise HTTPException(status_code=404, detail="Deal not found")
+
+            for field, value in changes.items():
+                setattr(deal, field, value)
+            deal.updated_at = datetime.now(timezone.utc)
+            session.add(deal)
+            if {"title", "description"} & changes.keys():
+                self.search_backend.index_deal(session, deal)
+            session.commit()
+            session.refresh(deal)
+
+        response_cache.invalidate(("deal", deal.id))
+        return deal
+
+    def _get_deal_version(self, deal_id) -> Optional[tuple]:
+        with self.db_services.SessionLocal() as session:
+            return session.exec(select(Deal.id, Deal.updated_at, Deal.created_at).where(Deal.id == deal_id)).first()
+
+    def _get_deal(self, deal_id) -> Deal:
+        with self.db_services.SessionLocal() as session:
+            deal = session.get(Deal, deal_id)
+            if deal is None:
+                raise HTTPException(status_code=404, detail="Deal not found")
+            return deal
+
+    def _search_deals(self, query, status, fund_manager_id, limit, offset) -> list[tuple[Deal, float]]:
+        with self.db_services.SessionLocal() as session:
+            return self.search_backend.search(
+                session, query, status=status, fund_manager_id=fund_manager_id, limit=limit, offset=offset
+            )
@@ -0,0 +1,67 @@
+import asyncio
+from typing import Optional
+from fastapi import HTTPException
+from sqlmodel import select
+from logging.logging_setup import get_logger
+from models.investment import Investment
+from services.db_services import DatabaseServices
+from utils.tracing import traced
+
+class InvestmentService:
+    """
+    Investment and portfolio reads. The `*_version(s)` methods fetch only id and timestamps so
+    routes can answer conditional GETs before loading or serializing the full rows.
+    """
+
+    def __init__(self, db_services: DatabaseServices):
+        self.db_services = db_services
+        self.logger = get_logger("InvestmentService", env="dev")
+
+    @traced()
+    async def get_investment_version(self, investment_id) -> Optional[tuple]:
+        return await asyncio.to_thread(self._get_investment_version, investment_id)
+
+    @traced()
+    async def get_investment(self, investment_id) -> Investment:
+        return await asyncio.to_thread(self._get_investment, investment_id)
+
+    @traced()
+    async def get_portfolio_versions(self, investor_id) -> list[tuple]:
+        """
+        (id, updated_at, created_at) for every investment of an investor, in portfolio order.
+        """
+        return await asyncio.to_thread(self._get_portfolio_versions, investor_id)
+
+    @traced()
+    async def get_portfolio(self, investor_id) -> list[Investment]:
+        return await asyncio.to_thread(self._get_portfolio, investor_id)
+
+    def _get_investment_version(self, investment_id) -> Optional[tuple]:
+        statement = select(Investment.id, Investment.updated_at, Investment.created_at).where(Investment.id == investment_id)
+        with self.db_services.SessionLocal() as session:
+            return session.exec(statement).first()
+
+    def _get_investment(self, investment_id) -> Investment:
+        with self.db_services.SessionLocal() as session:
+            investment = session.get(Investment, investment_id)
+            if investment is None:
+                raise HTTPException(status_code=404, detail="Investment not found")
+            return investment
+
+    def _get_portfolio_versions(self, investor_id) -> list[tuple]:
+        statement = (
+            select(Investment.id, Investment.updated_at, Investment.created_at)
+            .where(Investment.investor_id == investor_id)
+            .order_by(Investment.created_at, Investment.id)
+        )
+        with self.db_services.SessionLocal() as session:
+            return list(session.exec(statement).all())
+
+    def _get_portfolio(self, investor_id) -> list[Investment]:
+        statement = (
+            select(Investment)
+            .where(Investment.investor_id == investor_id)
+            .order_by(Investment.created_at, Investment.id)
+        )
+        with self.db_services.SessionLocal() as session:
+            return list(session.exec(statement).all())
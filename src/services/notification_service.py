@@ -0,0 +1,255 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import HTTPException
+from sqlalchemy import inspect, or_, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from logging.logging_setup import get_logger
+from models.notification import SmsCampaign, CampaignStatus
+from models.user import Role, User
+from schemas.validators import normalize_phone
+from services.db_services import DatabaseServices
+from services.phone_service import PhoneService
+from utils.rate_limiter import AsyncTokenBucket
+from utils.tracing import traced
+
+SMS_SOURCE = "FUNDOS"  # registered sender id
+SMS_DESTINATIONS_PER_REQUEST = 500  # Plivo accepts up to 1000 `<`-joined destinations
+SMS_MAX_CONCURRENT_REQUESTS = 4
+SMS_MESSAGES_PER_SECOND = 200
+SMS_MAX_ATTEMPTS = 3
+SMS_RETRY_BACKOFF_S = 1.0
+CAMPAIGN_LEASE_S = 120.0  # renewed at every page checkpoint
+
+DEAL_ANNOUNCEMENT_TEXT = "New deal from your fund manager: {title}. Open the Fundos app to view details."
+
+class DealAnnouncementService:
+    """
+    Fans a deal announcement SMS out to every investor of the deal's fund manager.
+
+    Recipients are read in keyset pages ordered by user id. Each page is split into
+    multi-destination Plivo requests that run concurrently (bounded by `max_concurrency`)
+    behind a messages-per-second token bucket. The campaign row records the last user id
+    of every finished page, so a crashed campaign resumes from there. Delivery is
+    at-least-once: a page interrupted mid-send is sent again on resume.
+
+    Only one worker sends a campaign at a time: `run_campaign` claims the row with a
+    conditional UPDATE that sets `claimed_by` and a lease, renews the lease at every
+    checkpoint and stops if it has lost it. A second call for a campaign that is already
+    being sent returns without sending anything.
+    """
+
+    def __init__(
+        self,
+        db_services: DatabaseServices,
+        phone_service: PhoneService,
+        batch_size: int = SMS_DESTINATIONS_PER_REQUEST,
+        max_concurrency: int = SMS_MAX_CONCURRENT_REQUESTS,
+        messages_per_second: float = SMS_MESSAGES_PER_SECOND,
+        source: str = SMS_SOURCE,
+        lease_seconds: float = CAMPAIGN_LEASE_S,
+    ):
+        self.db_services = db_services
+        self.phone_service = phone_service
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.source = source
+        self.lease_seconds = lease_seconds
+        self.rate_limiter = AsyncTokenBucket(rate=messages_per_second, capacity=max(batch_size, messages_per_second))
+        self.logger = get_logger("DealAnnouncementService", env="dev")
+
+    def ensure_schema(self) -> None:
+        """
+        Create the campaign table on databases that predate it and add the lease columns;
+        `create_all` neither runs on an existing SQLite file nor alters tables.
+        """
+        engine = self.db_services.engine
+        SmsCampaign.__table__.create(engine, checkfirst=True)
+        table = SmsCampaign.__tablename__
+        existing = {column["name"] for column in inspect(engine).get_columns(table)}
+        missing = [column for column in SmsCampaign.__table__.columns if column.name not in existing]
+        if missing:
+            with engine.begin() as connection:
+                for column in missing:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column.name} {column_type}"))
+            self.logger.info(f"Added {[column.name for column in missing]} to {table}")
+
+    @traced()
+    async def announce_deal(self, deal_id, fund_manager_id: int, title: str) -> SmsCampaign:
+        """
+        Start (or resume) the announcement campaign for a deal. Safe to call more than once,
+        including while another call is still sending it.
+        """
+        message = DEAL_ANNOUNCEMENT_TEXT.format(title=title)
+        campaign = await asyncio.to_thread(self._get_or_create_campaign, deal_id, fund_manager_id, message)
+        if campaign.status == CampaignStatus.COMPLETED:
+            return campaign
+        return await self.run_campaign(campaign.id) or campaign
+
+    async def resume_incomplete_campaigns(self) -> None:
+        """
+        Continue every campaign left running by a previous process. Campaigns still leased
+        (by a live worker, or by a crashed one whose lease has not run out) are retried once
+        the lease can have expired, until none are left running.
+        """
+        while True:
+            campaign_ids = await asyncio.to_thread(self._running_campaign_ids)
+            if not campaign_ids:
+                return
+            claimed = 0
+            for campaign_id in campaign_ids:
+                if await self.run_campaign(campaign_id) is not None:
+                    claimed += 1
+            if not claimed:
+                await asyncio.sleep(self.lease_seconds)
+
+    @traced()
+    async def run_campaign(self, campaign_id) -> Optional[SmsCampaign]:
+        """
+        Send a campaign to completion. Returns None without sending if another worker holds
+        the campaign or it is already completed.
+        """
+        owner = uuid.uuid4().hex
+        campaign = await asyncio.to_thread(self._claim_campaign, campaign_id, owner)
+        if campaign is None:
+            self.logger.info(f"SMS campaign {campaign_id} is completed or being sent by another worker")
+            return None
+        page_size = self.batch_size * self.max_concurrency
+
+        async with self.phone_service.get_client() as client:
+            while True:
+                page = await asyncio.to_thread(self._recipient_page, campaign.fund_manager_id, campaign.last_user_id, page_size)
+                if not page:
+                    break
+
+                destinations, skipped = self._destinations(page)
+                batches = [destinations[i:i + self.batch_size] for i in range(0, len(destinations), self.batch_size)]
+                results = await asyncio.gather(*(self._send_batch(client, campaign.message, batch) for batch in batches))
+
+                sent = sum(len(batch) for batch, ok in zip(batches, results) if ok)
+                checkpoint = await asyncio.to_thread(
+                    self._checkpoint, campaign.id, owner, page[-1][0], sent, len(destinations) - sent, skipped
+                )
+                if checkpoint is None:
+                    self.logger.error(f"Lost the lease on SMS campaign {campaign.id}; another worker took it over")
+                    return None
+                campaign = checkpoint
+
+        campaign = await asyncio.to_thread(
+            self._checkpoint, campaign.id, owner, campaign.last_user_id, 0, 0, 0, CampaignStatus.COMPLETED
+        )
+        if campaign is None:
+            self.logger.error(f"Lost the lease on SMS campaign {campaign_id} before completing it")
+            return None
+        self.logger.info(
+            f"SMS campaign {campaign.id} for deal {campaign.deal_id} completed: "
+            f"sent={campaign.sent_count} failed={campaign.failed_count} skipped={campaign.skipped_count}"
+        )
+        return campaign
+
+    async def _send_batch(self, client, message: str, destinations: list[str]) -> bool:
+        await self.rate_limiter.acquire(len(destinations))
+        for attempt in range(1, SMS_MAX_ATTEMPTS + 1):
+            try:
+                await self.phone_service.send_bulk_sms(self.source, destinations, message, client=client)
+                return True
+            except Exception as exc:
+                retryable = not isinstance(exc, HTTPException) or exc.status_code >= 500 or exc.status_code == 429
+                if not retryable or attempt == SMS_MAX_ATTEMPTS:
+                    self.logger.error(f"Bulk SMS to {len(destinations)} recipients failed after {attempt} attempt(s): {exc}")
+                    return False
+                await asyncio.sleep(SMS_RETRY_BACKOFF_S * 2 ** (attempt - 1))
+
+    @staticmethod
+    def _destinations(page: list[tuple]) -> tuple[list[str], int]:
+        destinations, skipped = [], 0
+        for _, phone_number in page:
+            try:
+                # Plivo wants the number without the leading `+`
+                destinations.append(normalize_phone(phone_number)[1:])
+            except ValueError:
+                skipped += 1
+        return destinations, skipped
+
+    def _recipient_page(self, fund_manager_id: int, after_user_id, limit: int) -> list[tuple]:
+        statement = (
+            select(User.id, User.phone_number)
+            # founders also sit under a fund manager; only investors get deal announcements
+            .where(User.fund_manager_id == fund_manager_id, User.role == Role.INVESTOR, User.phone_number.is_not(None))
+            .order_by(User.id)
+            .limit(limit)
+        )
+        if after_user_id is not None:
+            statement = statement.where(User.id > after_user_id)
+        with self.db_services.SessionLocal() as session:
+            return list(session.exec(statement).all())
+
+    def _get_or_create_campaign(self, deal_id, fund_manager_id: int, message: str) -> SmsCampaign:
+        statement = select(SmsCampaign).where(SmsCampaign.deal_id == deal_id)
+        with self.db_services.SessionLocal() as session:
+            campaign = session.exec(statement).first()
+            if campaign is not None:
+                return campaign
+            try:
+                campaign = SmsCampaign(deal_id=deal_id, fund_manager_id=fund_manager_id, message=message)
+                session.add(campaign)
+                session.commit()
+                session.refresh(campaign)
+                return campaign
+            except IntegrityError:
+                # a concurrent first call created it between our select and insert
+                session.rollback()
+                return session.exec(statement).one()
+
+    def _claim_campaign(self, campaign_id, owner: str) -> Optional[SmsCampaign]:
+        now = datetime.now(timezone.utc)
+        statement = (
+            update(SmsCampaign)
+            .where(
+                SmsCampaign.id == campaign_id,
+                SmsCampaign.status == CampaignStatus.RUNNING,
+                or_(SmsCampaign.lease_expires_at.is_(None), SmsCampaign.lease_expires_at < now),
+            )
+            .values(claimed_by=owner, lease_expires_at=now + timedelta(seconds=self.lease_seconds))
+        )
+        with self.db_services.SessionLocal() as session:
+            claimed = session.execute(statement).rowcount == 1
+            session.commit()
+            if not claimed:
+                if session.get(SmsCampaign, campaign_id) is None:
+                    raise HTTPException(status_code=404, detail="Campaign not found")
+                return None
+            return session.get(SmsCampaign, campaign_id)
+
+    def _running_campaign_ids(self) -> list:
+        with self.db_services.SessionLocal() as session:
+            return list(session.exec(select(SmsCampaign.id).where(SmsCampaign.status == CampaignStatus.RUNNING)).all())
+
+    def _checkpoint(self, campaign_id, owner: str, last_user_id, sent: int, failed: int, skipped: int,
+                    status: Optional[CampaignStatus] = None) -> Optional[SmsCampaign]:
+        """
+        Record a finished page and renew the lease; None if `owner` no longer holds the campaign.
+        """
+        now = datetime.now(timezone.utc)
+        values = {
+            "last_user_id": last_user_id,
+            "sent_count": SmsCampaign.sent_count + sent,
+            "failed_count": SmsCampaign.failed_count + failed,
+            "skipped_count": SmsCampaign.skipped_count + skipped,
+            "updated_at": now,
+            "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+        }
+        if status is not None:
+            values.update(status=status, claimed_by=None, lease_expires_at=None)
+        statement = (
+            update(SmsCampaign)
+            .where(SmsCampaign.id == campaign_id, SmsCampaign.claimed_by == owner)
+            .values(**values)
+        )
+        with self.db_services.SessionLocal() as session:
+            updated = session.execute(statement).rowcount == 1
+            session.commit()
+            return session.get(SmsCampaign, campaign_id) if updated else None
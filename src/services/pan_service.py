@@ -1,6 +1,7 @@
 import httpx
 import base64
 from fastapi import HTTPException
+from utils.tracing import traced, TracingTransport
 
 DIGITAP_BASE_URL = "https://svcdemo.digitap.work"
 CLIENT_ID = "your_client_id"
@@ -20,6 +21,7 @@ class PANService:
             "Content-Type": "application/json"
         }
 
+    @traced()
     async def verify_pan(self, unique_id: str, pan_number: str) -> dict:
         url = f"{self.base_url}/validation/kyc/v1/pan_basic"
         payload = {
@@ -28,7 +30,7 @@ class PANService:
         }
         headers = self.get_auth_header()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with httpx.AsyncClient(timeout=30.0, transport=TracingTransport()) as client:
             response = await client.post(url, json=payload, headers=headers)
 
         if response.status_code != 200:
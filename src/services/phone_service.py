@@ -1,16 +1,22 @@
 import httpx
 import base64
+from typing import Optional
 from fastapi import HTTPException
+from utils.tracing import traced, TracingTransport
 
 PLIVO_AUTH_ID = "your_auth_id"
 PLIVO_AUTH_TOKEN = "your_auth_token"
 PLIVO_BASE_URL = f"https://api.plivo.com/v1/Account/{PLIVO_AUTH_ID}"
 
 class PhoneService:
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.auth_id = PLIVO_AUTH_ID
         self.auth_token = PLIVO_AUTH_TOKEN
         self.base_url = PLIVO_BASE_URL
+        self.transport = transport  # None -> real network; see services/plivo_stub.py for local runs
+
+    def get_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=30.0, transport=TracingTransport(self.transport))
 
     def get_auth_header(self) -> dict:
         token = f"{self.auth_id}:{self.auth_token}"
@@ -20,6 +26,7 @@ class PhoneService:
             "Content-Type": "application/json"
         }
 
+    @traced()
     async def verify_phone_number(self, phone_number: str, alias: str = "UserVerification", channel: str = "sms") -> dict:
         url = f"{self.base_url}/VerifiedCallerId/"
         payload = {
@@ -29,7 +36,7 @@ class PhoneService:
         }
         headers = self.get_auth_header()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.get_client() as client:
             response = await client.post(url, json=payload, headers=headers)
 
         if response.status_code != 201:
@@ -40,6 +47,7 @@ class PhoneService:
             "message": data.get("message"),
             "verification_uuid": data.get("verification_uuid")
         }
+    @traced()
     async def verify_otp(self, session_uuid: str, otp_code: str) -> dict:
         url = f"{self.base_url}/Verify/Session/{session_uuid}/"
         payload = {
@@ -47,7 +55,7 @@ class PhoneService:
         }
         headers = self.get_auth_header()
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with self.get_client() as client:
             response = await client.post(url, json=payload, headers=headers)
 
         if response.status_code != 200:
@@ -59,3 +67,30 @@ class PhoneService:
             raise HTTPException(status_code=400, detail="Invalid OTP")
 
         return data
+
+    @traced()
+    async def send_bulk_sms(self, src: str, destinations: list[str], text: str,
+                            client: Optional[httpx.AsyncClient] = None) -> dict:
+        """
+        Send one SMS to many numbers in a single Plivo request (`dst` joined with `<`).
+        :param client: reuse a pooled client across batches; a new one is opened if omitted
+        :return: Plivo response with one `message_uuid` per destination
+        """
+        url = f"{self.base_url}/Message/"
+        payload = {
+            "src": src,
+            "dst": "<".join(destinations),
+            "text": text
+        }
+        headers = self.get_auth_header()
+
+        if client is None:
+            async with self.get_client() as own_client:
+                response = await own_client.post(url, json=payload, headers=headers)
+        else:
+            response = await client.post(url, json=payload, headers=headers)
+
+        if response.status_code != 202:
+            raise HTTPException(status_code=response.status_code, detail="Failed to send bulk SMS")
+
+        return response.json()
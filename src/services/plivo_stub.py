@@ -0,0 +1,38 @@
+import json
+import uuid
+import httpx
+
+class PlivoStub:
+    """
+    In-process stand-in for the Plivo Message API. Pass `PhoneService(transport=stub.transport)`
+    to send nothing over the network while keeping the request/response shapes.
+
+    :param fail_requests: request numbers (1-based) that answer 500, to exercise retries
+    :param max_destinations: Plivo's per-request destination limit
+    """
+
+    def __init__(self, fail_requests: tuple[int, ...] = (), max_destinations: int = 1000):
+        self.fail_requests = set(fail_requests)
+        self.max_destinations = max_destinations
+        self.requests = 0
+        self.delivered: list[str] = []
+        self.transport = httpx.MockTransport(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if not request.url.path.endswith("/Message/"):
+            return httpx.Response(404, json={"error": "not implemented in PlivoStub"})
+        if self.requests in self.fail_requests:
+            return httpx.Response(500, json={"error": "stubbed failure"})
+
+        payload = json.loads(request.content)
+        destinations = payload["dst"].split("<")
+        if len(destinations) > self.max_destinations:
+            return httpx.Response(400, json={"error": "too many destinations"})
+
+        self.delivered.extend(destinations)
+        return httpx.Response(202, json={
+            "api_id": str(uuid.uuid4()),
+            "message": "message(s) queued",
+            "message_uuid": [str(uuid.uuid4()) for _ in destinations],
+        })
@@ -0,0 +1,212 @@
+import asyncio
+import csv
+import json
+import os
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+from sqlalchemy import select, update
+from logging.logging_setup import get_logger
+from models.investment import Investment, PaymentStatus
+from services.db_services import DatabaseServices
+from utils.etag import response_cache
+from utils.tracing import traced
+
+RECONCILE_UPDATE_BATCH_SIZE = 1000
+RECONCILE_INDEX_FETCH_SIZE = 5000
+AMOUNT_TOLERANCE = 0.01
+
+# Razorpay / PayU settlement statuses mapped onto our payment lifecycle.
+GATEWAY_STATUS_MAP = {
+    "captured": PaymentStatus.COMPLETED,
+    "settled": PaymentStatus.COMPLETED,
+    "success": PaymentStatus.COMPLETED,
+    "completed": PaymentStatus.COMPLETED,
+    "failed": PaymentStatus.FAILED,
+    "failure": PaymentStatus.FAILED,
+    "cancelled": PaymentStatus.FAILED,
+    "refunded": PaymentStatus.FAILED,
+    "pending": PaymentStatus.PENDING,
+    "created": PaymentStatus.PENDING,
+    "authorized": PaymentStatus.PENDING,
+    "in_progress": PaymentStatus.PENDING,
+}
+
+class ReconciliationService:
+    """
+    Reconciles pending investments against a gateway settlement file.
+
+    Pending investments are loaded once into a dict keyed by `payment_id`, the settlement
+    file is streamed line by line, and status changes are written in batched UPDATEs.
+    Memory is bounded by the number of pending investments plus one update batch; the
+    settlement file and the mismatch report are never held in memory.
+    """
+
+    def __init__(self, db_services: DatabaseServices, batch_size: int = RECONCILE_UPDATE_BATCH_SIZE):
+        self.db_services = db_services
+        self.batch_size = batch_size
+        self.logger = get_logger("ReconciliationService", env="dev")
+
+    @traced()
+    async def reconcile_file(self, settlement_path: str, report_path: str) -> dict:
+        """
+        Run `reconcile` in a worker thread so it does not block the event loop.
+        """
+        return await asyncio.to_thread(self.reconcile, settlement_path, report_path)
+
+    @traced()
+    def reconcile(self, settlement_path: str, report_path: str) -> dict:
+        """
+        Match a CSV or JSONL settlement file against pending investments.
+        :param settlement_path: file with `payment_id`, `status` and optionally `amount` per row (amount in rupees)
+        :param report_path: JSONL file that receives one line per mismatch
+        :return: summary counts
+        """
+        index = self.build_pending_index()
+        summary = {
+            "rows": 0,
+            "matched": 0,
+            "completed": 0,
+            "failed": 0,
+            "still_pending": 0,
+            "mismatches": 0,
+            "missing_in_settlement": 0,
+        }
+        pending_updates: dict[PaymentStatus, list] = {PaymentStatus.COMPLETED: [], PaymentStatus.FAILED: []}
+        # Gateways report intermediate states (authorized, ...) before the final one, so an
+        # index entry is only consumed by a terminal row; these track payments that appeared.
+        seen: set[str] = set()
+        still_pending: set[str] = set()
+
+        with open(report_path, "w", encoding="utf-8") as report:
+            def mismatch(reason: str, **fields) -> None:
+                summary["mismatches"] += 1
+                report.write(json.dumps({"reason": reason, **fields}, default=str) + "\n")
+
+            for line_no, row in self.iter_settlement_rows(settlement_path):
+                summary["rows"] += 1
+                if not row:
+                    mismatch("malformed_row", line=line_no)
+                    continue
+
+                payment_id = row.get("payment_id")
+                payment_id = str(payment_id).strip() if payment_id is not None else None  # JSONL may carry numbers
+                raw_status = str(row.get("status") or "").strip().lower()
+
+                if not payment_id:
+                    mismatch("missing_payment_id", line=line_no)
+                    continue
+
+                entry = index.get(payment_id)
+                if entry is None:
+                    mismatch("unknown_or_already_reconciled", line=line_no, payment_id=payment_id, status=raw_status)
+                    continue
+                seen.add(payment_id)
+
+                investment_id, expected_amount = entry
+                status = GATEWAY_STATUS_MAP.get(raw_status)
+                if status is None:
+                    mismatch("unknown_status", line=line_no, payment_id=payment_id, investment_id=investment_id, status=raw_status)
+                    continue
+
+                raw_amount = row.get("amount")
+                amount = self._parse_amount(raw_amount)
+                if amount is None and raw_amount not in (None, ""):
+                    mismatch(
+                        "invalid_amount", line=line_no, payment_id=payment_id, investment_id=investment_id,
+                        expected=expected_amount, settled=raw_amount,
+                    )
+                    continue
+                if amount is not None and abs(amount - expected_amount) > AMOUNT_TOLERANCE:
+                    mismatch(
+                        "amount_mismatch", line=line_no, payment_id=payment_id, investment_id=investment_id,
+                        expected=expected_amount, settled=amount,
+                    )
+                    continue
+
+                summary["matched"] += 1
+                if status == PaymentStatus.PENDING:
+                    still_pending.add(payment_id)
+                    continue
+
+                del index[payment_id]
+                still_pending.discard(payment_id)
+                summary[status.value] += 1
+                pending_updates[status].append(investment_id)
+                if len(pending_updates[status]) >= self.batch_size:
+                    self._apply_status(status, pending_updates[status])
+                    pending_updates[status] = []
+
+            for status, investment_ids in pending_updates.items():
+                if investment_ids:
+                    self._apply_status(status, investment_ids)
+
+            summary["still_pending"] = len(still_pending)
+            for payment_id, (investment_id, expected_amount) in index.items():
+                if payment_id in seen:
+                    continue
+                summary["missing_in_settlement"] += 1
+                mismatch("missing_in_settlement", payment_id=payment_id, investment_id=investment_id, expected=expected_amount)
+
+        self.logger.info(f"Reconciled {settlement_path}: {summary}")
+        return summary
+
+    def build_pending_index(self) -> dict[str, tuple]:
+        """
+        Single streamed pass over pending investments: payment_id -> (investment id, amount).
+        """
+        index = {}
+        statement = (
+            select(Investment.id, Investment.payment_id, Investment.amount)
+            .where(Investment.payment_status == PaymentStatus.PENDING, Investment.payment_id.is_not(None))
+            .execution_options(yield_per=RECONCILE_INDEX_FETCH_SIZE)
+        )
+        with self.db_services.SessionLocal() as session:
+            for investment_id, payment_id, amount in session.execute(statement):
+                index[payment_id] = (investment_id, amount)
+        return index
+
+    def iter_settlement_rows(self, path: str) -> Iterator[tuple[int, dict]]:
+        """
+        Yield (line number, row) from a CSV or JSONL settlement file without loading it.
+        JSONL lines that are not JSON objects are yielded as `{}`.
+        """
+        is_jsonl = os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson")
+        with open(path, newline="", encoding="utf-8") as settlement:
+            if is_jsonl:
+                for line_no, line in enumerate(settlement, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:
+                        row = {}
+                    # scalars and arrays parse fine but are not rows; reported as malformed_row
+                    yield line_no, row if isinstance(row, dict) else {}
+            else:
+                reader = csv.DictReader(settlement)
+                for row in reader:
+                    yield reader.line_num, row
+
+    def _apply_status(self, status: PaymentStatus, investment_ids: list) -> None:
+        # The pending guard keeps a concurrent webhook update from being overwritten.
+        statement = (
+            update(Investment)
+            .where(Investment.id.in_(investment_ids), Investment.payment_status == PaymentStatus.PENDING)
+            .values(payment_status=status, updated_at=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        with self.db_services.SessionLocal() as session:
+            session.execute(statement)
+            session.commit()
+        for investment_id in investment_ids:
+            response_cache.invalidate(("investment", investment_id))
+        response_cache.invalidate_kind("portfolio")
+
+    @staticmethod
+    def _parse_amount(value) -> Optional[float]:
+        if value in (None, ""):
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
@@ -4,12 +4,15 @@ from fastapi import UploadFile
 from typing import Optional
 import logging
 from urllib.parse import urlparse
+from utils.tracing import traced, instrument_boto3_client
 
 class S3Service:
     def __init__(self, bucket_name: str, region_name: str = "us-east-1"):
         self.bucket_name = bucket_name
         self.s3_client = boto3.client("s3", region_name=region_name)
+        instrument_boto3_client(self.s3_client)
 
+    @traced()
     def upload_file(self, file: UploadFile, object_name: Optional[str] = None) -> str:
         """
         Uploads a file to S3.
@@ -27,6 +30,7 @@ class S3Service:
             raise e
         return object_name
 
+    @traced()
     def generate_presigned_url(self, object_name: str, expiration: int = 3600) -> str:
         """
         Generates a presigned URL to access the uploaded file.
@@ -45,6 +49,7 @@ class S3Service:
             raise e
         return response
     
+    @traced()
     def delete_file(self, file_uri: str) -> None:
         """
         Deletes a file from S3 given its URI.
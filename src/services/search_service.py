@@ -0,0 +1,186 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Optional
+from sqlalchemy import Engine, column, delete, func, insert, literal_column, select, table, text, update
+from sqlmodel import Session
+from models.deal import Deal, DealStatus
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+MAX_QUERY_TOKENS = 8
+
+def tokenize_query(query: str) -> list[str]:
+    """
+    Split free text into search terms. Everything except word characters is dropped, so
+    user input can never inject FTS5 / tsquery operators.
+    """
+    return TOKEN_PATTERN.findall(query.lower())[:MAX_QUERY_TOKENS]
+
+class DealSearchBackend(ABC):
+    """
+    Full-text index over `Deal.title` and `Deal.description`.
+
+    `index_deal` / `remove_deal` run inside the caller's session so the index changes commit
+    atomically with the deal row itself.
+    """
+
+    @abstractmethod
+    def ensure_index(self, engine: Engine) -> None:
+        ...
+
+    @abstractmethod
+    def index_deal(self, session: Session, deal: Deal) -> None:
+        ...
+
+    @abstractmethod
+    def remove_deal(self, session: Session, deal: Deal) -> None:
+        ...
+
+    @abstractmethod
+    def search(
+        self,
+        session: Session,
+        query: str,
+        status: Optional[DealStatus] = None,
+        fund_manager_id: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[tuple[Deal, float]]:
+        """
+        Return (deal, score) pairs, best match first. Every term is prefix-matched.
+        """
+
+    @staticmethod
+    def _apply_filters(statement, status: Optional[DealStatus], fund_manager_id: Optional[int]):
+        if status is not None:
+            statement = statement.where(Deal.status == status)
+        if fund_manager_id is not None:
+            statement = statement.where(Deal.fund_manager_id == fund_manager_id)
+        return statement
+
+class SqliteDealSearch(DealSearchBackend):
+    """
+    FTS5 table holding the deal id as an UNINDEXED column. Deal ids are UUIDs, so the deal's
+    implicit rowid is not a stable key (VACUUM may renumber it); queries join on the id instead.
+    `deal_fts_rowid` maps each deal id to its FTS row so updates touch one row by rowid
+    rather than scanning the unindexed column.
+    """
+    # title matches weigh 10x description matches in bm25; weights are positional and the
+    # first column is deal_id, which never matches
+    TITLE_WEIGHT = 10.0
+    DESCRIPTION_WEIGHT = 1.0
+
+    fts = table("deal_fts", column("rowid"), column("deal_id", Deal.__table__.c.id.type), column("title"), column("description"))
+    fts_rowids = table("deal_fts_rowid", column("deal_id", Deal.__table__.c.id.type), column("fts_rowid"))
+
+    def ensure_index(self, engine: Engine) -> None:
+        """
+        Create the index if needed and backfill deals that are not in it yet, so deals that
+        predate the index (or an index from an earlier release) stay searchable.
+        """
+        with engine.begin() as conn:
+            fts_columns = [row[1] for row in conn.execute(text("PRAGMA table_info(deal_fts)"))]
+            has_rowid_map = bool(list(conn.execute(text("PRAGMA table_info(deal_fts_rowid)"))))
+            if fts_columns and ("deal_id" not in fts_columns or not has_rowid_map):
+                conn.execute(text("DROP TABLE deal_fts"))
+                fts_columns = []
+            if not fts_columns:
+                conn.execute(text("DROP TABLE IF EXISTS deal_fts_rowid"))
+
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS deal_fts USING fts5("
+                "deal_id UNINDEXED, title, description, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            ))
+            conn.execute(text(
+                "CREATE TABLE IF NOT EXISTS deal_fts_rowid (deal_id CHAR(32) PRIMARY KEY, fts_rowid INTEGER NOT NULL)"
+            ))
+            conn.execute(text(
+                "INSERT INTO deal_fts(deal_id, title, description) SELECT id, title, description FROM deal "
+                "WHERE id NOT IN (SELECT deal_id FROM deal_fts_rowid)"
+            ))
+            conn.execute(text(
+                "INSERT INTO deal_fts_rowid(deal_id, fts_rowid) SELECT deal_id, rowid FROM deal_fts "
+                "WHERE deal_id NOT IN (SELECT deal_id FROM deal_fts_rowid)"
+            ))
+
+    def index_deal(self, session: Session, deal: Deal) -> None:
+        fts_rowid = self._fts_rowid(session, deal)
+        if fts_rowid is not None:
+            session.execute(
+                update(self.fts).where(self.fts.c.rowid == fts_rowid).values(title=deal.title, description=deal.description)
+            )
+            return
+        result = session.execute(insert(self.fts).values(deal_id=deal.id, title=deal.title, description=deal.description))
+        session.execute(insert(self.fts_rowids).values(deal_id=deal.id, fts_rowid=result.lastrowid))
+
+    def remove_deal(self, session: Session, deal: Deal) -> None:
+        fts_rowid = self._fts_rowid(session, deal)
+        if fts_rowid is None:
+            return
+        session.execute(delete(self.fts).where(self.fts.c.rowid == fts_rowid))
+        session.execute(delete(self.fts_rowids).where(self.fts_rowids.c.deal_id == deal.id))
+
+    def _fts_rowid(self, session: Session, deal: Deal) -> Optional[int]:
+        return session.execute(
+            select(self.fts_rowids.c.fts_rowid).where(self.fts_rowids.c.deal_id == deal.id)
+        ).scalar_one_or_none()
+
+    def search(self, session, query, status=None, fund_manager_id=None, limit=20, offset=0):
+        tokens = tokenize_query(query)
+        if not tokens:
+            return []
+
+        match = " ".join(f'"{token}"*' for token in tokens)
+        # bm25 is lower-is-better; negate so higher scores rank first like ts_rank
+        score = literal_column(f"-bm25(deal_fts, 0.0, {self.TITLE_WEIGHT}, {self.DESCRIPTION_WEIGHT})").label("score")
+        statement = (
+            select(Deal, score)
+            .join(self.fts, self.fts.c.deal_id == Deal.id)
+            .where(text("deal_fts MATCH :match").bindparams(match=match))
+        )
+        statement = self._apply_filters(statement, status, fund_manager_id)
+        statement = statement.order_by(score.desc()).limit(limit).offset(offset)
+        return [(deal, float(rank)) for deal, rank in session.execute(statement)]
+
+class PostgresDealSearch(DealSearchBackend):
+    """
+    Stored generated tsvector column with a GIN index; Postgres keeps it current on every
+    write, so the incremental hooks are no-ops.
+    """
+    search_vector = literal_column("deal.search_vector")
+
+    def ensure_index(self, engine: Engine) -> None:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE deal ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+                "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')) STORED"
+            ))
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_deal_search_vector ON deal USING GIN (search_vector)"))
+
+    def index_deal(self, session: Session, deal: Deal) -> None:
+        pass
+
+    def remove_deal(self, session: Session, deal: Deal) -> None:
+        pass
+
+    def search(self, session, query, status=None, fund_manager_id=None, limit=20, offset=0):
+        tokens = tokenize_query(query)
+        if not tokens:
+            return []
+
+        ts_query = func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+        score = func.ts_rank(self.search_vector, ts_query).label("score")
+        statement = select(Deal, score).where(self.search_vector.op("@@")(ts_query))
+        statement = self._apply_filters(statement, status, fund_manager_id)
+        statement = statement.order_by(score.desc()).limit(limit).offset(offset)
+        return [(deal, float(rank)) for deal, rank in session.execute(statement)]
+
+def get_deal_search_backend(engine: Engine) -> DealSearchBackend:
+    """
+    Pick the full-text backend matching the database dialect.
+    """
+    if engine.dialect.name == "sqlite":
+        return SqliteDealSearch()
+    if engine.dialect.name == "postgresql":
+        return PostgresDealSearch()
+    raise ValueError(f"Deal search is not supported on {engine.dialect.name}")
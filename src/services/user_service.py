@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import HTTPException
+from sqlmodel import select
+from logging.logging_setup import get_logger
+from models.user import User
+from services.db_services import DatabaseServices
+from utils.etag import response_cache
+from utils.ttl_cache import MultiKeyTTLCache
+from utils.tracing import traced
+
+USER_CACHE_MAX_ENTRIES = 10_000
+USER_CACHE_TTL_S = 300.0
+INVITATION_NEGATIVE_TTL_S = 60.0
+
+LOOKUP_FIELDS = ("email", "phone_number", "invitation_code")
+
+class UserService:
+    """
+    User lookups by id, email, phone number or invitation code, read through an in-process
+    cache. All four keys point at one cache entry, so `update_user` invalidates every one of
+    them. Unknown invitation codes are cached as misses to absorb brute-force guessing.
+
+    Cached users are detached instances shared between callers; treat them as read-only and
+    make changes through `update_user`.
+    """
+
+    def __init__(self, db_services: DatabaseServices, cache: Optional[MultiKeyTTLCache] = None):
+        self.db_services = db_services
+        self.cache = cache or MultiKeyTTLCache(
+            max_entries=USER_CACHE_MAX_ENTRIES,
+            ttl=USER_CACHE_TTL_S,
+            negative_ttl=INVITATION_NEGATIVE_TTL_S,
+        )
+        self.logger = get_logger("UserService", env="dev")
+
+    @traced()
+    async def get_user_by_id(self, user_id) -> Optional[User]:
+        return await self._lookup(("id", user_id))
+
+    @traced()
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        return await self._lookup(("email", email))
+
+    @traced()
+    async def get_user_by_phone(self, phone_number: str) -> Optional[User]:
+        return await self._lookup(("phone_number", phone_number))
+
+    @traced()
+    async def get_user_by_invitation_code(self, invitation_code: str) -> Optional[User]:
+        return await self._lookup(("invitation_code", invitation_code))
+
+    @traced()
+    async def update_user(self, user_id, changes: dict) -> User:
+        """
+        Apply `changes` to a user and invalidate every cache key that can reach it.
+        """
+        return await asyncio.to_thread(self._update_user, user_id, changes)
+
+    def cache_stats(self) -> dict:
+        return self.cache.stats()
+
+    async def _lookup(self, key: tuple) -> Optional[User]:
+        found, user = self.cache.get(key)
+        if found:
+            return user
+
+        generation = self.cache.generation
+        user = await asyncio.to_thread(self._load, *key)
+        if user is not None:
+            self._remember(user, generation)
+        elif key[0] == "invitation_code":
+            self.cache.set_negative(key, generation=generation)
+        return user
+
+    def _load(self, field: str, value) -> Optional[User]:
+        with self.db_services.SessionLocal() as session:
+            return session.exec(select(User).where(getattr(User, field) == value).limit(1)).first()
+
+    def _remember(self, user: User, generation: Optional[int] = None) -> None:
+        aliases = [(field, getattr(user, field)) for field in LOOKUP_FIELDS if getattr(user, field) is not None]
+        self.cache.set(("id", user.id), user, aliases=aliases, generation=generation)
+
+    def _update_user(self, user_id, changes: dict) -> User:
+        with self.db_services.SessionLocal() as session:
+            user = session.get(User, user_id)
+            if user is None:
+                raise HTTPException(status_code=404, detail="User not found")
+
+            for field, value in changes.items():
+                setattr(user, field, value)
+            user.updated_at = datetime.now(timezone.utc)
+            session.add(user)
+            session.commit()
+            session.refresh(user)
+
+        # drop the old entry (and its old email/phone/code aliases) plus any cached misses for the new values
+        new_keys = [(field, changes[field]) for field in LOOKUP_FIELDS if changes.get(field) is not None]
+        self.cache.invalidate(("id", user.id), extra_keys=new_keys)
+        response_cache.invalidate(("user", user.id))
+        return user
@@ -0,0 +1,78 @@
+import numpy as np
+
+def to_units(amounts, unit: float = 0.01) -> np.ndarray:
+    """
+    Convert rupee amounts to integer units (paise by default) so rounding is exact.
+    """
+    return np.rint(np.asarray(amounts, dtype=np.float64) / unit).astype(np.int64)
+
+def allocate_pro_rata(commitments: np.ndarray, capacity: int, min_ticket: int = 0) -> np.ndarray:
+    """
+    Scale commitments back to `capacity` pro-rata, all in integer units.
+
+    - No investor is allocated more than they committed.
+    - Commitments whose pro-rata share would fall below `min_ticket` are dropped (allocated 0),
+      smallest first, and their share is redistributed to the rest.
+    - Rounding uses the largest-remainder method, so allocations sum to exactly `capacity`
+      whenever the surviving commitments exceed it. Ties go to the earlier commitment.
+
+    :param commitments: 1-d int array of committed amounts, in commitment order
+    :param capacity: deal size in the same units
+    :param min_ticket: smallest allocation worth keeping, in the same units
+    :return: int64 array of allocations aligned with `commitments`
+    """
+    commitments = np.asarray(commitments, dtype=np.int64)
+    allocations = np.zeros_like(commitments)
+    if commitments.size == 0 or capacity <= 0:
+        return allocations
+    if commitments.sum() <= capacity:
+        return commitments.copy()
+
+    # Pro-rata shares are proportional to commitments, so investors fall below the minimum
+    # ticket smallest-first. With commitments sorted ascending, keeping the suffix from k
+    # onwards is valid iff the smallest kept share clears the minimum; that is monotone in k.
+    if min_ticket > 0:
+        order = np.argsort(commitments, kind="stable")
+        sorted_commitments = commitments[order].astype(np.float64)
+        suffix_totals = np.cumsum(sorted_commitments[::-1])[::-1]
+        smallest_share = sorted_commitments * np.minimum(1.0, capacity / suffix_totals)
+        valid = smallest_share >= min_ticket
+        if not valid.any():
+            return allocations
+        active = np.sort(order[int(np.argmax(valid)):])
+    else:
+        active = np.arange(commitments.size)
+
+    kept = commitments[active]
+    kept_total = int(kept.sum())
+    if kept_total <= capacity:
+        allocations[active] = kept
+        return allocations
+
+    exact = kept * (capacity / kept_total)
+    rounded = np.minimum(np.floor(exact).astype(np.int64), kept)
+    remainder = exact - rounded
+    shortfall = capacity - int(rounded.sum())
+
+    # Largest remainders get the leftover units. Float error can leave the floor sum one
+    # unit over, in which case the smallest remainders give one back.
+    if shortfall > 0:
+        eligible = np.flatnonzero(rounded < kept)
+        rounded[eligible[_top_k(remainder[eligible], shortfall)]] += 1
+    elif shortfall < 0:
+        eligible = np.flatnonzero(rounded > 0)
+        rounded[eligible[_top_k(-remainder[eligible], -shortfall)]] -= 1
+
+    allocations[active] = rounded
+    return allocations
+
+def _top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the `k` largest values in O(n), ties broken by position (earlier wins).
+    """
+    if k >= values.size:
+        return np.arange(values.size)
+    kth = np.partition(values, values.size - k)[values.size - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - above.size]
+    return np.concatenate([above, ties])
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+RESPONSE_CACHE_MAX_ENTRIES = 4096  # 0 disables body caching; ETags and 304s still work
+ETAG_CACHE_CONTROL = "private, no-cache"  # clients must revalidate, which is exactly the cheap 304 path
+
+def make_etag(row_id, updated_at: Optional[datetime], created_at: Optional[datetime] = None) -> str:
+    """
+    Strong ETag for one row, derived from its id and last-modified timestamp.
+    """
+    version = updated_at or created_at
+    digest = hashlib.sha256(f"{row_id}:{version.isoformat() if version else ''}".encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+def make_collection_etag(kind: str, versions: Iterable[tuple]) -> str:
+    """
+    Strong ETag for a list of rows given (id, updated_at, created_at) tuples in response order.
+    """
+    digest = hashlib.sha256(kind.encode())
+    for row_id, updated_at, created_at in versions:
+        version = updated_at or created_at
+        digest.update(f"|{row_id}:{version.isoformat() if version else ''}".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    `If-None-Match` check; uses weak comparison as RFC 9110 requires for this header.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+class ResponseCache:
+    """
+    Bounded LRU of serialized response bodies keyed by ETag. Each body is also filed under a
+    resource key like ("deal", id) so service-layer writes can drop it explicitly.
+    """
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._bodies: OrderedDict[str, tuple[Hashable, bytes]] = OrderedDict()
+        self._by_resource: dict[Hashable, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, etag: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._bodies.get(etag)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._bodies.move_to_end(etag)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, resource_key: Hashable, etag: str, body: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._bodies[etag] = (resource_key, body)
+            self._bodies.move_to_end(etag)
+            self._by_resource.setdefault(resource_key, set()).add(etag)
+            while len(self._bodies) > self.max_entries:
+                oldest, (oldest_key, _) = self._bodies.popitem(last=False)
+                self._forget(oldest_key, oldest)
+
+    def invalidate(self, resource_key: Hashable) -> None:
+        with self._lock:
+            for etag in self._by_resource.pop(resource_key, ()):
+                self._bodies.pop(etag, None)
+
+    def invalidate_kind(self, kind: str) -> None:
+        """
+        Drop every cached body whose resource key starts with `kind`, for bulk writes.
+        """
+        with self._lock:
+            for resource_key in [key for key in self._by_resource if isinstance(key, tuple) and key[0] == kind]:
+                for etag in self._by_resource.pop(resource_key):
+                    self._bodies.pop(etag, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._bodies), "hits": self.hits, "misses": self.misses}
+
+    def _forget(self, resource_key: Hashable, etag: str) -> None:
+        etags = self._by_resource.get(resource_key)
+        if etags is not None:
+            etags.discard(etag)
+            if not etags:
+                del self._by_resource[resource_key]
+
+response_cache = ResponseCache()
+
+async def conditional_json(request: Request, etag: str, resource_key: Hashable,
+                           build: Callable[[], Awaitable[Any]]) -> Response:
+    """
+    Answer a read with 304 when the client already has `etag`, else with the cached body for
+    `etag`, else by awaiting `build()` and serializing (and caching) its result.
+    """
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    body = response_cache.get(etag)
+    if body is None:
+        content = await build()
+        body = json.dumps(jsonable_encoder(content), separators=(",", ":")).encode()
+        response_cache.set(resource_key, etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from routes.kyc import audit_service
+from routes.deal import deal_service, allocation_service, announcement_service
+from db.db_connection import db_services
+from configs.app_configs import AppConfigs
+from utils.loop_monitor import EventLoopMonitor
+from utils.tracing import BatchSpanExporter, configure_exporter
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app_configs = AppConfigs()
+    app.state.loop_monitor = None
+    if app_configs.LOOP_MONITOR_ENABLED:
+        app.state.loop_monitor = EventLoopMonitor(
+            interval=app_configs.LOOP_MONITOR_INTERVAL_MS / 1000,
+            block_threshold=app_configs.LOOP_MONITOR_BLOCK_THRESHOLD_MS / 1000,
+        )
+        app.state.loop_monitor.start()
+
+    span_exporter = None
+    if app_configs.TRACING_ENABLED:
+        span_exporter = BatchSpanExporter(
+            file_path=app_configs.TRACING_FILE_PATH or None,
+            otlp_endpoint=app_configs.TRACING_OTLP_ENDPOINT or None,
+            service_name=app_configs.TRACING_SERVICE_NAME,
+        )
+        span_exporter.start()
+        configure_exporter(span_exporter)
+
+    db_services.init_db()
+    allocation_service.ensure_schema()
+    announcement_service.ensure_schema()
+    deal_service.init_search_index()
+    await audit_service.start()
+    # pick up SMS campaigns a previous process did not finish
+    resume_campaigns = asyncio.create_task(announcement_service.resume_incomplete_campaigns())
+    try:
+        yield
+    finally:
+        resume_campaigns.cancel()
+        # flush buffered KYC audit events before the process exits
+        await audit_service.stop()
+        if app.state.loop_monitor is not None:
+            await app.state.loop_monitor.stop()
+        if span_exporter is not None:
+            configure_exporter(None)
+            await asyncio.to_thread(span_exporter.shutdown)
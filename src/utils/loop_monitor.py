@@ -0,0 +1,133 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Optional
+from logging.logging_setup import get_logger
+
+LAG_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+MAX_RECORDED_STALLS = 20
+
+class LagHistogram:
+    """
+    Cumulative-bucket histogram of event-loop lag in milliseconds (Prometheus style).
+    """
+
+    def __init__(self, buckets: tuple = LAG_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value_ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def snapshot(self) -> dict:
+        cumulative, running = {}, 0
+        for bound, bucket_count in zip((*map(str, self.buckets), "+Inf"), self.counts):
+            running += bucket_count
+            cumulative[bound] = running
+        return {
+            "buckets_ms": cumulative,
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+class EventLoopMonitor:
+    """
+    Measures event-loop lag and catches callbacks that block the loop.
+
+    A probe task sleeps `interval` seconds and records how late it wakes up. A watchdog
+    thread checks the probe's heartbeat; when the loop has not run the probe for longer
+    than `block_threshold`, it captures the loop thread's current stack, which is the
+    code doing the blocking (sync boto3, the sync DB engine, file logging, ...). Cost is a
+    few wake-ups per second plus one stack capture per stall.
+    """
+
+    def __init__(self, interval: float = 0.1, block_threshold: float = 0.2):
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.histogram = LagHistogram()
+        self.stalls: deque[dict] = deque(maxlen=MAX_RECORDED_STALLS)
+        self.stall_count = 0
+        self._lock = threading.Lock()  # the watchdog thread writes stalls; snapshot may run in the threadpool
+        self.logger = get_logger("EventLoopMonitor", env="dev")
+
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._probe: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._probe = asyncio.get_running_loop().create_task(self._run_probe(), name="event-loop-monitor")
+        self._watchdog = threading.Thread(target=self._run_watchdog, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._probe is not None:
+            self._probe.cancel()
+            try:
+                await self._probe
+            except asyncio.CancelledError:
+                pass
+            self._probe = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "interval_ms": self.interval * 1000,
+                "block_threshold_ms": self.block_threshold * 1000,
+                "lag": self.histogram.snapshot(),
+                "stall_count": self.stall_count,
+                "recent_stalls": list(self.stalls),
+            }
+
+    async def _run_probe(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            with self._lock:
+                self.histogram.observe(max(0.0, now - expected) * 1000)
+
+    def _run_watchdog(self) -> None:
+        reported_heartbeat = None
+        while not self._stopped.wait(self.block_threshold / 2):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            if blocked_for < self.block_threshold or heartbeat == reported_heartbeat:
+                continue
+
+            # one report per stall: capture the stack once, while the loop is still stuck
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "<loop thread not found>"
+            with self._lock:
+                self.stall_count += 1
+                self.stalls.append({
+                    "detected_at": time.time(),
+                    "blocked_for_ms": round(blocked_for * 1000, 1),
+                    "stack": stack,
+                })
+            self.logger.warning(f"Event loop blocked for {blocked_for * 1000:.0f} ms:\n{stack}")
@@ -0,0 +1,319 @@
+import functools
+import inspect
+import json
+import logging
+import queue
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+import httpx
+
+TRACEPARENT_HEADER = "traceparent"
+SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    kind: str = "internal"
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: Optional[int] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or time.time_ns()) - self.start_ns) / 1e6
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_exporter: Optional["BatchSpanExporter"] = None
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+def parse_traceparent(header: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    (trace_id, parent span_id) from a W3C `traceparent` header, or (None, None) if absent/invalid.
+    """
+    if not header:
+        return None, None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or parts[1] == "0" * 32:
+        return None, None
+    try:
+        int(parts[1], 16), int(parts[2], 16)
+    except ValueError:
+        return None, None
+    return parts[1], parts[2]
+
+@contextmanager
+def start_span(name: str, kind: str = "internal", traceparent: Optional[str] = None, **attributes):
+    """
+    Open a span as a child of the current one (or of `traceparent`, or as a new trace) and make
+    it current for the block. Works in sync and async code since it only touches contextvars.
+    """
+    parent = _current_span.get()
+    if parent is not None:
+        trace_id, parent_id = parent.trace_id, parent.span_id
+    else:
+        trace_id, parent_id = parse_traceparent(traceparent)
+    span = Span(
+        name=name,
+        trace_id=trace_id or secrets.token_hex(16),
+        span_id=secrets.token_hex(8),
+        parent_id=parent_id,
+        kind=kind,
+        attributes=attributes,
+    )
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        _current_span.reset(token)
+        end_span(span)
+
+def end_span(span: Span) -> None:
+    span.end_ns = time.time_ns()
+    if _exporter is not None:
+        _exporter.submit(span)
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator wrapping a sync or async function in a span named `Class.method` by default.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with start_span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that records a client span per outbound request and forwards the trace
+    context in a `traceparent` header.
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with start_span(
+            f"HTTP {request.method} {request.url.host}",
+            kind="client",
+            **{"http.method": request.method, "http.url": str(request.url.copy_with(query=None))},
+        ) as span:
+            request.headers[TRACEPARENT_HEADER] = span.traceparent
+            response = await self.transport.handle_async_request(request)
+            span.attributes["http.status_code"] = response.status_code
+            return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+def instrument_engine(engine) -> None:
+    """
+    Record a client span around every SQL statement executed on a SQLAlchemy engine.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        parent = _current_span.get()
+        if parent is None:
+            return
+        span = Span(
+            name=f"DB {statement.split(None, 1)[0].upper() if statement else 'QUERY'}",
+            trace_id=parent.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id,
+            kind="client",
+            attributes={"db.system": engine.dialect.name, "db.statement": statement[:500], "db.executemany": executemany},
+        )
+        conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        spans = conn.info.get("trace_spans")
+        if spans:
+            end_span(spans.pop())
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        spans = conn.info.get("trace_spans") if conn is not None else None
+        if spans:
+            span = spans.pop()
+            span.error = repr(exception_context.original_exception)
+            end_span(span)
+
+def instrument_boto3_client(client) -> None:
+    """
+    Record a client span around every API call made by a boto3 client.
+    """
+    service = client.meta.service_model.service_name
+
+    def _before(model, context, **kwargs):
+        parent = _current_span.get()
+        if parent is None:
+            return
+        context["trace_span"] = Span(
+            name=f"AWS {service}.{model.name}",
+            trace_id=parent.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id,
+            kind="client",
+            attributes={"aws.service": service, "aws.operation": model.name},
+        )
+
+    def _after(http_response, context, **kwargs):
+        span = context.pop("trace_span", None)
+        if span is not None:
+            span.attributes["http.status_code"] = getattr(http_response, "status_code", None)
+            end_span(span)
+
+    client.meta.events.register("before-call.*.*", _before)
+    client.meta.events.register("after-call.*.*", _after)
+
+class BatchSpanExporter:
+    """
+    Ships finished spans from a background thread in batches, either appended to a JSONL file
+    or POSTed to an OTLP/HTTP (JSON) collector. Request threads only enqueue; when the queue
+    is full spans are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(self, file_path: Optional[str] = None, otlp_endpoint: Optional[str] = None,
+                 service_name: str = "fundos", batch_size: int = 512, flush_interval: float = 2.0,
+                 max_queue: int = 20_000):
+        if not file_path and not otlp_endpoint:
+            raise ValueError("BatchSpanExporter needs a file_path or an otlp_endpoint")
+        self.file_path = file_path
+        self.otlp_endpoint = otlp_endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue[Span] = queue.Queue(maxsize=max_queue)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._logger = logging.getLogger("tracing")
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def shutdown(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def submit(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        with httpx.Client(timeout=5.0) as client:
+            while not self._stopped.is_set() or not self._queue.empty():
+                batch = self._next_batch()
+                if not batch:
+                    continue
+                try:
+                    self._export(client, batch)
+                except Exception as exc:
+                    self._logger.warning(f"Dropped {len(batch)} spans: {exc}")
+
+    def _next_batch(self) -> list[Span]:
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            try:
+                if self._stopped.is_set():
+                    # drain without waiting on shutdown
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _export(self, client: httpx.Client, batch: list[Span]) -> None:
+        if self.file_path:
+            with open(self.file_path, "a", encoding="utf-8") as spans_file:
+                spans_file.writelines(json.dumps(self._as_dict(span), default=str) + "\n" for span in batch)
+        if self.otlp_endpoint:
+            client.post(self.otlp_endpoint, json=self._as_otlp(batch)).raise_for_status()
+
+    @staticmethod
+    def _as_dict(span: Span) -> dict:
+        return {
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "kind": span.kind,
+            "start_ns": span.start_ns,
+            "duration_ms": round(span.duration_ms, 3),
+            "attributes": span.attributes,
+            "error": span.error,
+        }
+
+    def _as_otlp(self, batch: list[Span]) -> dict:
+        def attribute(key, value):
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        return {"resourceSpans": [{
+            "resource": {"attributes": [attribute("service.name", self.service_name)]},
+            "scopeSpans": [{
+                "scope": {"name": "fundos.tracing"},
+                "spans": [{
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    **({"parentSpanId": span.parent_id} if span.parent_id else {}),
+                    "name": span.name,
+                    "kind": SPAN_KINDS.get(span.kind, 1),
+                    "startTimeUnixNano": str(span.start_ns),
+                    "endTimeUnixNano": str(span.end_ns),
+                    "attributes": [attribute(key, value) for key, value in span.attributes.items() if value is not None],
+                    "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+                } for span in batch],
+            }],
+        }]}
+
+def configure_exporter(exporter: Optional[BatchSpanExporter]) -> None:
+    """
+    Install the exporter that receives finished spans; None disables export.
+    """
+    global _exporter
+    _exporter = exporter
@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+class MultiKeyTTLCache:
+    """
+    Bounded LRU cache with a TTL, where several lookup keys can point at one entry.
+
+    Entries are stored under a primary key; alias keys such as ("email", value) resolve to
+    it, so invalidating the primary key drops every way of reaching the entry. Misses can
+    be remembered separately (negative caching) with their own TTL and bound. Safe to use
+    from worker threads.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 300.0,
+                 max_negative_entries: int = 10_000, negative_ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_negative_entries = max_negative_entries
+        self.negative_ttl = negative_ttl
+
+        self._entries: OrderedDict[Hashable, tuple[Any, float, tuple]] = OrderedDict()
+        self._aliases: dict[Hashable, Hashable] = {}
+        self._negative: OrderedDict[Hashable, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped on every invalidation, see `set`
+        self._stats = {"hits": 0, "misses": 0, "negative_hits": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """
+        Look up by primary or alias key. Returns (found, value); a remembered miss is
+        reported as (True, None).
+        """
+        now = time.monotonic()
+        with self._lock:
+            primary = self._aliases.get(key, key)
+            entry = self._entries.get(primary)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at > now:
+                    self._entries.move_to_end(primary)
+                    self._stats["hits"] += 1
+                    return True, value
+                self._drop(primary)
+                self._stats["expirations"] += 1
+
+            negative_expiry = self._negative.get(key)
+            if negative_expiry is not None:
+                if negative_expiry > now:
+                    self._stats["negative_hits"] += 1
+                    return True, None
+                del self._negative[key]
+
+            self._stats["misses"] += 1
+            return False, None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, primary: Hashable, value: Any, aliases: Iterable[Hashable] = (), generation: int | None = None) -> None:
+        """
+        Store `value`. Pass the `generation` read before loading it from the source of truth;
+        if an invalidation happened in between the value may be stale and is not cached.
+        """
+        aliases = tuple(alias for alias in aliases if alias is not None)
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if primary in self._entries:
+                self._drop(primary)
+            self._entries[primary] = (value, time.monotonic() + self.ttl, aliases)
+            for alias in aliases:
+                self._aliases[alias] = primary
+                self._negative.pop(alias, None)
+            self._negative.pop(primary, None)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._stats["evictions"] += 1
+
+    def set_negative(self, key: Hashable, generation: int | None = None) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._negative[key] = time.monotonic() + self.negative_ttl
+            self._negative.move_to_end(key)
+            while len(self._negative) > self.max_negative_entries:
+                self._negative.popitem(last=False)
+
+    def invalidate(self, primary: Hashable, extra_keys: Iterable[Hashable] = ()) -> None:
+        """
+        Drop an entry with all its aliases, plus any remembered misses for `extra_keys`
+        (e.g. the new email a user was just updated to).
+        """
+        with self._lock:
+            self._generation += 1
+            if primary in self._entries:
+                self._drop(primary)
+                self._stats["invalidations"] += 1
+            self._negative.pop(primary, None)
+            for key in extra_keys:
+                self._negative.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._negative.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["negative_hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "negative_size": len(self._negative),
+                "hit_ratio": round((self._stats["hits"] + self._stats["negative_hits"]) / lookups, 4) if lookups else 0.0,
+            }
+
+    def _drop(self, primary: Hashable) -> None:
+        _, _, aliases = self._entries.pop(primary)
+        for alias in aliases:
+            if self._aliases.get(alias) == primary:
+                del self._aliases[alias]
@@ -0,0 +1,24 @@
+import logging
+import os
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+
+# src/logging (logging_setup) shares its name with the stdlib package pytest has already
+# imported; extend the package path so `from logging.logging_setup import ...` resolves.
+logging.__path__.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), "src", "logging"))
+
+@pytest.fixture
+def db_services():
+    """
+    DatabaseServices bound to a fresh in-memory SQLite database with every table created.
+    """
+    from services.db_services import DatabaseServices
+    import models.audit, models.deal, models.investment, models.notification, models.user  # noqa: F401 register tables
+
+    services = DatabaseServices("sqlite://")
+    services.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    services.SessionLocal.configure(bind=services.engine)
+    SQLModel.metadata.create_all(services.engine)
+    yield services
+    services.engine.dispose()
@@ -0,0 +1,38 @@
+import numpy as np
+from utils.allocation import allocate_pro_rata, to_units, _top_k
+
+def test_to_units_rounds_to_paise():
+    assert to_units([12.34, 0.1 + 0.2, 1]).tolist() == [1234, 30, 100]
+
+def test_undersubscribed_deal_allocates_full_commitments():
+    commitments = np.array([100, 200, 300])
+    assert allocate_pro_rata(commitments, capacity=1000).tolist() == [100, 200, 300]
+
+def test_oversubscribed_deal_sums_to_capacity_and_never_exceeds_commitment():
+    rng = np.random.default_rng(7)
+    commitments = rng.integers(1, 10_000, size=5_000)
+    capacity = int(commitments.sum() // 3)
+    allocations = allocate_pro_rata(commitments, capacity)
+    assert allocations.sum() == capacity
+    assert (allocations <= commitments).all()
+    assert (allocations >= 0).all()
+
+def test_largest_remainder_ties_go_to_earlier_commitment():
+    assert allocate_pro_rata(np.array([1, 1, 1]), capacity=2).tolist() == [1, 1, 0]
+
+def test_min_ticket_drops_smallest_and_redistributes():
+    # pro-rata shares would be 45, 45, 10; the 10 is below the ticket and is dropped
+    allocations = allocate_pro_rata(np.array([450, 450, 100]), capacity=100, min_ticket=20)
+    assert allocations.tolist() == [50, 50, 0]
+
+def test_min_ticket_above_every_share_allocates_nothing():
+    assert allocate_pro_rata(np.array([10, 10]), capacity=5, min_ticket=100).tolist() == [0, 0]
+
+def test_empty_and_zero_capacity():
+    assert allocate_pro_rata(np.array([], dtype=np.int64), capacity=10).tolist() == []
+    assert allocate_pro_rata(np.array([5, 5]), capacity=0).tolist() == [0, 0]
+
+def test_top_k_breaks_ties_by_position():
+    values = np.array([0.5, 0.9, 0.5, 0.5, 0.1])
+    assert sorted(_top_k(values, 3).tolist()) == [0, 1, 2]
+    assert sorted(_top_k(values, 10).tolist()) == [0, 1, 2, 3, 4]
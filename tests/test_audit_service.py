@@ -0,0 +1,74 @@
+import asyncio
+import os
+import pytest
+from fastapi import HTTPException
+from sqlmodel import select
+from models.audit import AuditOutcome, KycAuditEvent, KycEventType
+from services.audit_service import AuditService
+
+EVENT_TYPE = next(iter(KycEventType))
+
+def audit_rows(db_services) -> list[KycAuditEvent]:
+    with db_services.SessionLocal() as session:
+        return list(session.exec(select(KycAuditEvent)).all())
+
+def test_full_buffer_rejects_with_503(db_services, tmp_path):
+    audit = AuditService(db_services, max_buffer=2, enqueue_timeout=0.05, spill_dir=str(tmp_path))
+
+    async def run():
+        await audit.record(EVENT_TYPE, "a", AuditOutcome.SUCCESS)
+        await audit.record(EVENT_TYPE, "b", AuditOutcome.SUCCESS)
+        with pytest.raises(HTTPException) as exc_info:
+            await audit.record(EVENT_TYPE, "c", AuditOutcome.SUCCESS)
+        return exc_info.value
+
+    assert asyncio.run(run()).status_code == 503
+    assert len(audit._buffer) == 2
+
+def test_concurrent_records_respect_the_buffer_bound(db_services, tmp_path):
+    audit = AuditService(db_services, max_buffer=5, enqueue_timeout=0.05, spill_dir=str(tmp_path))
+
+    async def run():
+        return await asyncio.gather(
+            *(audit.record(EVENT_TYPE, str(i), AuditOutcome.SUCCESS) for i in range(8)), return_exceptions=True
+        )
+
+    rejected = [result for result in asyncio.run(run()) if isinstance(result, HTTPException)]
+    assert len(rejected) == 3
+    assert len(audit._buffer) == 5
+
+def test_stop_flushes_buffer_and_removes_segments(db_services, tmp_path):
+    audit = AuditService(db_services, batch_size=2, flush_interval=60, spill_dir=str(tmp_path))
+
+    async def run():
+        await audit.start()
+        for i in range(5):
+            await audit.record(EVENT_TYPE, f"user-{i}", AuditOutcome.FAILURE, status_code=502)
+        await audit.stop()
+
+    asyncio.run(run())
+    rows = audit_rows(db_services)
+    assert sorted(row.subject_ref for row in rows) == [f"user-{i}" for i in range(5)]
+    assert os.listdir(tmp_path) == []
+
+def test_start_replays_leftover_segments_once(db_services, tmp_path):
+    crashed = AuditService(db_services, batch_size=2, spill_dir=str(tmp_path))
+
+    async def record_without_flushing():
+        for i in range(3):
+            await crashed.record(EVENT_TYPE, f"user-{i}", AuditOutcome.SUCCESS)
+
+    asyncio.run(record_without_flushing())
+    assert len(os.listdir(tmp_path)) == 2
+    # the first event made it to the table before the crash; replay must not duplicate it
+    crashed._insert_batch([crashed._buffer[0]])
+
+    async def restart():
+        audit = AuditService(db_services, spill_dir=str(tmp_path))
+        await audit.start()
+        await audit.stop()
+
+    asyncio.run(restart())
+    rows = audit_rows(db_services)
+    assert sorted(row.subject_ref for row in rows) == ["user-0", "user-1", "user-2"]
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,122 @@
+import asyncio
+import uuid
+from sqlmodel import select
+from models.notification import CampaignStatus, SmsCampaign
+from models.user import Role, User
+from services.notification_service import DealAnnouncementService
+from services.phone_service import PhoneService
+from services.plivo_stub import PlivoStub
+
+FUND_MANAGER_ID = 7
+
+def add_users(db_services, count: int, role: Role = Role.INVESTOR, fund_manager_id: int = FUND_MANAGER_ID) -> list[str]:
+    """
+    Returns the Plivo-format numbers of the added users, in user id (keyset) order.
+    """
+    users = []
+    with db_services.SessionLocal() as session:
+        for _ in range(count):
+            n = len(session.exec(select(User.id)).all()) + len(users)
+            users.append(User(
+                invitation_code="INV", email=f"user{n}@example.com", phone_number=f"98765{n:05d}", role=role,
+                occupation="engineer", income_source=1, annual_income=1, capital_commitment=1,
+                fund_manager_id=fund_manager_id, hashed_password=None, updated_at=None, profile_image_url=None,
+            ))
+        session.add_all(users)
+        session.commit()
+        return [f"91{user.phone_number}" for user in sorted(users, key=lambda user: user.id)]
+
+def make_service(db_services, stub: PlivoStub, **kwargs) -> DealAnnouncementService:
+    options = {"batch_size": 2, "max_concurrency": 1, "messages_per_second": 10_000, **kwargs}
+    return DealAnnouncementService(db_services, PhoneService(transport=stub.transport), **options)
+
+def get_campaign(db_services, deal_id) -> SmsCampaign:
+    with db_services.SessionLocal() as session:
+        return session.exec(select(SmsCampaign).where(SmsCampaign.deal_id == deal_id)).one()
+
+def test_concurrent_announcements_send_to_each_investor_once(db_services):
+    investors = add_users(db_services, 7)
+    add_users(db_services, 2, role=Role.FOUNDER)
+    add_users(db_services, 2, fund_manager_id=FUND_MANAGER_ID + 1)
+    stub = PlivoStub()
+    service = make_service(db_services, stub, lease_seconds=0.2)  # resume polls held campaigns once per lease
+    deal_id = uuid.uuid4()
+
+    async def announce_twice():
+        await asyncio.gather(
+            service.announce_deal(deal_id, FUND_MANAGER_ID, "Solar farm"),
+            service.announce_deal(deal_id, FUND_MANAGER_ID, "Solar farm"),
+            service.resume_incomplete_campaigns(),
+        )
+        await service.announce_deal(deal_id, FUND_MANAGER_ID, "Solar farm")  # already completed: no-op
+
+    asyncio.run(announce_twice())
+
+    assert sorted(stub.delivered) == sorted(investors)
+    campaign = get_campaign(db_services, deal_id)
+    assert campaign.status == CampaignStatus.COMPLETED
+    assert (campaign.sent_count, campaign.claimed_by) == (7, None)
+
+def test_resume_continues_after_the_last_checkpoint(db_services):
+    investors = add_users(db_services, 5)
+    deal_id = uuid.uuid4()
+    with db_services.SessionLocal() as session:
+        cursor = sorted(session.exec(select(User.id)).all())[1]  # a crash after the first page of two
+        session.add(SmsCampaign(deal_id=deal_id, fund_manager_id=FUND_MANAGER_ID, message="hi",
+                                last_user_id=cursor, sent_count=2))
+        session.commit()
+    stub = PlivoStub()
+
+    asyncio.run(make_service(db_services, stub).resume_incomplete_campaigns())
+
+    assert stub.delivered == investors[2:]
+    campaign = get_campaign(db_services, deal_id)
+    assert (campaign.status, campaign.sent_count) == (CampaignStatus.COMPLETED, 5)
+
+def test_resume_waits_out_a_crashed_workers_lease(db_services):
+    investors = add_users(db_services, 3)
+    service = make_service(db_services, PlivoStub(), lease_seconds=0.2)
+    deal_id = uuid.uuid4()
+    campaign = service._get_or_create_campaign(deal_id, FUND_MANAGER_ID, "hi")
+    assert service._claim_campaign(campaign.id, "crashed-worker") is not None
+
+    stub = PlivoStub()
+    service.phone_service = PhoneService(transport=stub.transport)
+    asyncio.run(service.resume_incomplete_campaigns())
+
+    assert stub.delivered == investors
+    assert get_campaign(db_services, deal_id).status == CampaignStatus.COMPLETED
+
+def test_worker_that_lost_its_lease_stops_sending(db_services):
+    investors = add_users(db_services, 6)
+    deal_id = uuid.uuid4()
+
+    class StealingStub(PlivoStub):
+        def _handle(self, request):
+            response = super()._handle(request)
+            if self.requests == 1:
+                # another worker takes the campaign over while the first page is in flight
+                with db_services.SessionLocal() as session:
+                    campaign = session.exec(select(SmsCampaign).where(SmsCampaign.deal_id == deal_id)).one()
+                    campaign.claimed_by = "other-worker"
+                    session.add(campaign)
+                    session.commit()
+            return response
+
+    stub = StealingStub()
+    result = asyncio.run(make_service(db_services, stub).announce_deal(deal_id, FUND_MANAGER_ID, "Solar farm"))
+
+    assert stub.delivered == investors[:2]
+    campaign = get_campaign(db_services, deal_id)
+    assert campaign.status == CampaignStatus.RUNNING
+    assert campaign.claimed_by == "other-worker"
+    assert campaign.sent_count == 0  # the checkpoint belonged to the new owner
+    assert result.status == CampaignStatus.RUNNING
+
+def test_second_claim_is_refused_while_leased(db_services):
+    service = make_service(db_services, PlivoStub())
+    campaign = service._get_or_create_campaign(uuid.uuid4(), FUND_MANAGER_ID, "hi")
+    assert service._claim_campaign(campaign.id, "first") is not None
+    assert service._claim_campaign(campaign.id, "second") is None
+    assert service._checkpoint(campaign.id, "second", None, 1, 0, 0) is None
+    assert service._checkpoint(campaign.id, "first", None, 1, 0, 0).sent_count == 1
@@ -0,0 +1,68 @@
+import asyncio
+from sqlalchemy import text
+from models.deal import Deal, DealStatus
+from services.deal_service import DealService
+
+def make_service(db_services) -> DealService:
+    service = DealService(db_services)
+    service.init_search_index()
+    return service
+
+def search(service, query, **filters) -> list[str]:
+    return [deal.title for deal, _ in asyncio.run(service.search_deals(query, **filters))]
+
+def test_title_match_outranks_description_match(db_services):
+    service = make_service(db_services)
+    for i in range(50):
+        asyncio.run(service.create_deal(1, f"Filler {i}", "nothing to see here", 1.0))
+    # the description hit is in a shorter field, so only the title weight puts the title hit first
+    asyncio.run(service.create_deal(1, "Rooftop", "Solar", 1.0))
+    asyncio.run(service.create_deal(1, "Solar panels for rural schools and clinics", "Seed round for a utility scale installer", 1.0))
+
+    assert search(service, "solar") == ["Solar panels for rural schools and clinics", "Rooftop"]
+
+def test_prefix_match_and_filters(db_services):
+    service = make_service(db_services)
+    asyncio.run(service.create_deal(1, "Solar farm", "Utility scale", 1.0))
+    closed = asyncio.run(service.create_deal(2, "Solarium chain", "Wellness", 1.0))
+    asyncio.run(service.update_deal(closed.id, {"status": DealStatus.CLOSED}))
+
+    assert sorted(search(service, "sol")) == ["Solar farm", "Solarium chain"]
+    assert search(service, "sol", fund_manager_id=2) == ["Solarium chain"]
+    assert search(service, "sol", status=DealStatus.OPEN) == ["Solar farm"]
+    assert search(service, "sol farm") == ["Solar farm"]
+    assert search(service, '" OR *') == []
+
+def test_update_reindexes_only_that_deal(db_services):
+    service = make_service(db_services)
+    deal = asyncio.run(service.create_deal(1, "Solar farm", "Utility scale", 1.0))
+    asyncio.run(service.create_deal(1, "Wind farm", "Offshore", 1.0))
+
+    asyncio.run(service.update_deal(deal.id, {"title": "Hydro plant"}))
+
+    assert search(service, "solar") == []
+    assert search(service, "hydro") == ["Hydro plant"]
+    assert sorted(search(service, "farm")) == ["Wind farm"]
+    with db_services.engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM deal_fts")).scalar() == 2
+
+def test_existing_deals_are_backfilled_once(db_services):
+    with db_services.SessionLocal() as session:
+        session.add(Deal(fund_manager_id=1, title="Legacy solar", description="Before the index", amount=1.0,
+                         updated_at=None, legal_document_url=None))
+        session.commit()
+
+    service = make_service(db_services)
+    service.init_search_index()
+
+    assert search(service, "legacy") == ["Legacy solar"]
+    with db_services.engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM deal_fts")).scalar() == 1
+
+def test_index_updates_do_not_scan_the_fts_table(db_services):
+    make_service(db_services)
+    with db_services.engine.connect() as conn:
+        plan = " ".join(str(row) for row in conn.execute(text(
+            "EXPLAIN QUERY PLAN SELECT fts_rowid FROM deal_fts_rowid WHERE deal_id = 'x'"
+        )))
+        assert "SCAN" not in plan
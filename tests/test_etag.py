@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime, timezone
+from starlette.requests import Request
+from utils import etag as etag_module
+from utils.etag import ResponseCache, conditional_json, etag_matches, make_collection_etag, make_etag
+
+UPDATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+def test_make_etag_is_quoted_and_tracks_version():
+    tag = make_etag(1, UPDATED)
+    assert tag.startswith('"') and tag.endswith('"')
+    assert tag == make_etag(1, None, UPDATED)  # falls back to created_at
+    assert tag != make_etag(1, datetime(2026, 1, 2, tzinfo=timezone.utc))
+    assert tag != make_etag(2, UPDATED)
+
+def test_collection_etag_depends_on_members_and_order():
+    a, b = (1, UPDATED, None), (2, None, UPDATED)
+    assert make_collection_etag("portfolio:x", [a, b]) == make_collection_etag("portfolio:x", [a, b])
+    assert make_collection_etag("portfolio:x", [a, b]) != make_collection_etag("portfolio:x", [b, a])
+    assert make_collection_etag("portfolio:x", [a]) != make_collection_etag("portfolio:x", [a, b])
+    assert make_collection_etag("portfolio:x", []) != make_collection_etag("portfolio:y", [])
+
+def test_etag_matches():
+    tag = '"abc"'
+    assert etag_matches('"abc"', tag)
+    assert etag_matches('"xyz", "abc"', tag)
+    assert etag_matches('W/"abc"', tag)  # If-None-Match uses weak comparison
+    assert etag_matches("*", tag)
+    assert not etag_matches('"abcd"', tag)
+    assert not etag_matches("abc", tag)
+    assert not etag_matches(None, tag)
+    assert not etag_matches("", tag)
+
+def test_response_cache_lru_and_invalidation():
+    cache = ResponseCache(max_entries=2)
+    cache.set(("deal", 1), '"a"', b"A")
+    cache.set(("deal", 2), '"b"', b"B")
+    assert cache.get('"a"') == b"A"
+    cache.set(("deal", 3), '"c"', b"C")  # evicts "b", the least recently used
+    assert cache.get('"b"') is None
+
+    cache.invalidate(("deal", 1))
+    assert cache.get('"a"') is None
+    cache.set(("portfolio", 1), '"p"', b"P")
+    cache.invalidate_kind("portfolio")
+    assert cache.get('"p"') is None
+    assert cache.get('"c"') == b"C"
+
+def test_disabled_response_cache_stores_nothing():
+    cache = ResponseCache(max_entries=0)
+    cache.set(("deal", 1), '"a"', b"A")
+    assert cache.get('"a"') is None
+
+def test_conditional_json_skips_build_on_match_and_reuses_cached_body(monkeypatch):
+    monkeypatch.setattr(etag_module, "response_cache", ResponseCache())
+    builds = []
+
+    async def build():
+        builds.append(1)
+        return {"id": 1}
+
+    tag = make_etag(1, UPDATED)
+    not_modified = asyncio.run(conditional_json(make_request(tag), tag, ("deal", 1), build))
+    assert not_modified.status_code == 304 and not_modified.body == b""
+    assert not_modified.headers["etag"] == tag
+    assert builds == []
+
+    first = asyncio.run(conditional_json(make_request(), tag, ("deal", 1), build))
+    second = asyncio.run(conditional_json(make_request('"stale"'), tag, ("deal", 1), build))
+    assert first.status_code == second.status_code == 200
+    assert first.body == second.body == b'{"id":1}'
+    assert builds == [1]
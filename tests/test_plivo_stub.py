@@ -0,0 +1,40 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from services.phone_service import PhoneService
+from services.plivo_stub import PlivoStub
+
+def test_bulk_sms_reaches_every_destination():
+    stub = PlivoStub()
+    phone_service = PhoneService(transport=stub.transport)
+
+    async def send():
+        async with phone_service.get_client() as client:
+            first = await phone_service.send_bulk_sms("FUNDOS", ["919876543210", "919876543211"], "hi", client=client)
+            second = await phone_service.send_bulk_sms("FUNDOS", ["919876543212"], "hi", client=client)
+        return first, second
+
+    first, second = asyncio.run(send())
+    assert len(first["message_uuid"]) == 2 and len(second["message_uuid"]) == 1
+    assert stub.requests == 2
+    assert stub.delivered == ["919876543210", "919876543211", "919876543212"]
+
+def test_stubbed_failure_surfaces_as_http_exception():
+    stub = PlivoStub(fail_requests=(1,))
+    phone_service = PhoneService(transport=stub.transport)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(phone_service.send_bulk_sms("FUNDOS", ["919876543210"], "hi"))
+    assert exc_info.value.status_code == 500
+    assert stub.delivered == []
+
+    asyncio.run(phone_service.send_bulk_sms("FUNDOS", ["919876543210"], "hi"))
+    assert stub.delivered == ["919876543210"]
+
+def test_destination_limit_is_enforced():
+    stub = PlivoStub(max_destinations=2)
+    phone_service = PhoneService(transport=stub.transport)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(phone_service.send_bulk_sms("FUNDOS", ["1", "2", "3"], "hi"))
+    assert exc_info.value.status_code == 400
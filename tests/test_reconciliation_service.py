@@ -0,0 +1,111 @@
+import json
+import uuid
+from sqlmodel import select
+from models.investment import Investment, PaymentStatus
+from services.reconciliation_service import ReconciliationService
+
+def add_investments(db_services, *payments: tuple[str, float]) -> dict[str, uuid.UUID]:
+    ids = {}
+    with db_services.SessionLocal() as session:
+        for payment_id, amount in payments:
+            investment = Investment(investor_id=uuid.uuid4(), deal_id=uuid.uuid4(), amount=amount,
+                                    payment_id=payment_id, signed_document_url=None, updated_at=None)
+            session.add(investment)
+            ids[payment_id] = investment.id
+        session.commit()
+    return ids
+
+def statuses(db_services) -> dict[str, PaymentStatus]:
+    with db_services.SessionLocal() as session:
+        return {i.payment_id: i.payment_status for i in session.exec(select(Investment)).all()}
+
+def read_report(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+def test_csv_settlement_updates_statuses_and_reports_mismatches(db_services, tmp_path):
+    add_investments(db_services, ("pay_1", 100.0), ("pay_2", 50.0), ("pay_3", 75.0), ("pay_4", 10.0), ("pay_5", 20.0))
+    settlement = tmp_path / "settlement.csv"
+    settlement.write_text(
+        "payment_id,status,amount\n"
+        "pay_1,captured,100.00\n"
+        "pay_2,failed,\n"
+        "pay_3,captured,70.00\n"
+        "pay_4,captured,1o.00\n"
+        "pay_9,captured,5\n"
+        ",captured,5\n"
+    )
+    report = tmp_path / "report.jsonl"
+
+    summary = ReconciliationService(db_services, batch_size=1).reconcile(str(settlement), str(report))
+
+    assert statuses(db_services) == {
+        "pay_1": PaymentStatus.COMPLETED,
+        "pay_2": PaymentStatus.FAILED,
+        "pay_3": PaymentStatus.PENDING,
+        "pay_4": PaymentStatus.PENDING,
+        "pay_5": PaymentStatus.PENDING,
+    }
+    assert summary["completed"] == 1 and summary["failed"] == 1
+    reasons = {(entry["reason"], entry.get("payment_id")) for entry in read_report(report)}
+    assert reasons == {
+        ("amount_mismatch", "pay_3"),
+        ("invalid_amount", "pay_4"),
+        ("unknown_or_already_reconciled", "pay_9"),
+        ("missing_payment_id", None),
+        ("missing_in_settlement", "pay_5"),
+    }
+
+def test_intermediate_status_does_not_consume_the_payment(db_services, tmp_path):
+    add_investments(db_services, ("pay_1", 100.0), ("pay_2", 100.0))
+    settlement = tmp_path / "settlement.csv"
+    settlement.write_text(
+        "payment_id,status,amount\n"
+        "pay_1,authorized,100\n"
+        "pay_1,captured,100\n"
+        "pay_2,authorized,100\n"
+        "pay_1,captured,100\n"
+    )
+    report = tmp_path / "report.jsonl"
+
+    summary = ReconciliationService(db_services).reconcile(str(settlement), str(report))
+
+    assert statuses(db_services) == {"pay_1": PaymentStatus.COMPLETED, "pay_2": PaymentStatus.PENDING}
+    assert summary["completed"] == 1
+    assert summary["still_pending"] == 1
+    assert summary["missing_in_settlement"] == 0
+    # the duplicate capture arrives after pay_1 was reconciled
+    assert [(e["reason"], e["line"]) for e in read_report(report)] == [("unknown_or_already_reconciled", 5)]
+
+def test_jsonl_numeric_ids_and_malformed_lines(db_services, tmp_path):
+    add_investments(db_services, ("123", 100.0), ("pay_2", 50.0))
+    settlement = tmp_path / "settlement.jsonl"
+    settlement.write_text("\n".join([
+        json.dumps({"payment_id": 123, "status": "settled", "amount": 100}),
+        '"oops"',
+        "[1]",
+        "{not json",
+        "",
+        json.dumps({"payment_id": "pay_2", "status": "refunded"}),
+    ]) + "\n")
+    report = tmp_path / "report.jsonl"
+
+    summary = ReconciliationService(db_services).reconcile(str(settlement), str(report))
+
+    assert statuses(db_services) == {"123": PaymentStatus.COMPLETED, "pay_2": PaymentStatus.FAILED}
+    assert summary["rows"] == 5
+    assert [(e["reason"], e["line"]) for e in read_report(report)] == [
+        ("malformed_row", 2), ("malformed_row", 3), ("malformed_row", 4),
+    ]
+
+def test_status_change_never_overwrites_a_settled_investment(db_services, tmp_path):
+    add_investments(db_services, ("pay_1", 100.0))
+    service = ReconciliationService(db_services)
+    index = service.build_pending_index()
+    with db_services.SessionLocal() as session:
+        investment = session.exec(select(Investment)).one()
+        investment.payment_status = PaymentStatus.FAILED  # webhook lands after the index was built
+        session.add(investment)
+        session.commit()
+
+    service._apply_status(PaymentStatus.COMPLETED, [index["pay_1"][0]])
+    assert statuses(db_services) == {"pay_1": PaymentStatus.FAILED}
@@ -0,0 +1,77 @@
+from utils import ttl_cache
+from utils.ttl_cache import MultiKeyTTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_cache(monkeypatch, **kwargs) -> tuple[MultiKeyTTLCache, FakeClock]:
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+    return MultiKeyTTLCache(**kwargs), clock
+
+def test_aliases_resolve_to_primary_entry(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set(("id", 1), "alice", aliases=[("email", "a@x.com"), None])
+    assert cache.get(("id", 1)) == (True, "alice")
+    assert cache.get(("email", "a@x.com")) == (True, "alice")
+    assert cache.get(("email", "b@x.com")) == (False, None)
+
+def test_invalidate_drops_every_alias(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set(("id", 1), "alice", aliases=[("email", "a@x.com"), ("phone_number", "+911")])
+    cache.invalidate(("id", 1))
+    assert cache.get(("email", "a@x.com")) == (False, None)
+    assert cache.get(("phone_number", "+911")) == (False, None)
+    assert cache.stats()["invalidations"] == 1
+
+def test_invalidate_clears_negative_entries_for_new_values(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set_negative(("email", "new@x.com"))
+    assert cache.get(("email", "new@x.com")) == (True, None)
+    cache.invalidate(("id", 1), extra_keys=[("email", "new@x.com")])
+    assert cache.get(("email", "new@x.com")) == (False, None)
+
+def test_stale_generation_is_not_cached(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    generation = cache.generation
+    cache.invalidate(("id", 1))  # a write lands while the old row is being loaded
+    cache.set(("id", 1), "stale", generation=generation)
+    cache.set_negative(("invitation_code", "X"), generation=generation)
+    assert cache.get(("id", 1)) == (False, None)
+    assert cache.get(("invitation_code", "X")) == (False, None)
+
+    cache.set(("id", 1), "fresh", generation=cache.generation)
+    assert cache.get(("id", 1)) == (True, "fresh")
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache, clock = make_cache(monkeypatch, ttl=10.0, negative_ttl=1.0)
+    cache.set(("id", 1), "alice", aliases=[("email", "a@x.com")])
+    cache.set_negative(("invitation_code", "X"))
+    clock.now += 5
+    assert cache.get(("invitation_code", "X")) == (False, None)
+    assert cache.get(("email", "a@x.com")) == (True, "alice")
+    clock.now += 6
+    assert cache.get(("email", "a@x.com")) == (False, None)
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+def test_lru_eviction_keeps_recently_used(monkeypatch):
+    cache, _ = make_cache(monkeypatch, max_entries=2)
+    cache.set(("id", 1), "a", aliases=[("email", "a@x.com")])
+    cache.set(("id", 2), "b")
+    cache.get(("id", 1))
+    cache.set(("id", 3), "c")
+    assert cache.get(("id", 2)) == (False, None)
+    assert cache.get(("email", "a@x.com")) == (True, "a")
+    assert cache.stats()["evictions"] == 1
+
+def test_reset_entry_replaces_old_aliases(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set(("id", 1), "alice", aliases=[("email", "a@x.com")])
+    cache.set(("id", 1), "alice2", aliases=[("email", "b@x.com")])
+    assert cache.get(("email", "a@x.com")) == (False, None)
+    assert cache.get(("email", "b@x.com")) == (True, "alice2")
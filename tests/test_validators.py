@@ -0,0 +1,71 @@
+import pytest
+from pydantic import BaseModel, ValidationError
+from schemas.validators import (
+    AadhaarNumber, PanNumber, PhoneNumber, normalize_aadhaar, normalize_pan, normalize_phone,
+    rejection_counts, verhoeff_valid,
+)
+
+def with_check_digit(body: str) -> str:
+    return next(body + digit for digit in "0123456789" if verhoeff_valid(body + digit))
+
+def test_verhoeff_reference_value():
+    # worked example from the Verhoeff algorithm description: 236 -> check digit 3
+    assert verhoeff_valid("2363")
+    assert not verhoeff_valid("2364")
+
+def test_verhoeff_has_exactly_one_check_digit():
+    body = "23456789012"
+    assert sum(verhoeff_valid(body + digit) for digit in "0123456789") == 1
+
+def test_verhoeff_catches_adjacent_transposition():
+    number = with_check_digit("98765432101")
+    swapped = number[:3] + number[4] + number[3] + number[5:]
+    assert number != swapped
+    assert not verhoeff_valid(swapped)
+
+def test_normalize_aadhaar_strips_separators():
+    number = with_check_digit("23456789012")
+    assert normalize_aadhaar(f"{number[:4]} {number[4:8]}-{number[8:]}") == number
+
+@pytest.mark.parametrize("value", ["123456789012", "2345678901", "23456789012a"])
+def test_normalize_aadhaar_rejects_bad_shape(value):
+    with pytest.raises(ValueError):
+        normalize_aadhaar(value)
+
+def test_normalize_aadhaar_rejects_bad_check_digit():
+    number = with_check_digit("23456789012")
+    bad = number[:-1] + str((int(number[-1]) + 1) % 10)
+    with pytest.raises(ValueError, match="Invalid Aadhaar"):
+        normalize_aadhaar(bad)
+
+def test_normalize_pan():
+    assert normalize_pan(" abcpe1234f ") == "ABCPE1234F"
+    with pytest.raises(ValueError):
+        normalize_pan("ABCXE1234F")  # X is not a holder type
+
+@pytest.mark.parametrize("value", ["9876543210", "09876543210", "919876543210", "+91 98765-43210", "0091 9876543210"])
+def test_normalize_phone_indian_formats(value):
+    assert normalize_phone(value) == "+919876543210"
+
+def test_normalize_phone_keeps_foreign_e164():
+    assert normalize_phone("+1 (415) 555-0100") == "+14155550100"
+
+@pytest.mark.parametrize("value", ["12345", "5876543210", "+9112345", "+910876543210"])
+def test_normalize_phone_rejects(value):
+    with pytest.raises(ValueError):
+        normalize_phone(value)
+
+def test_annotated_types_normalize_and_count_rejections():
+    class Details(BaseModel):
+        aadhaar_number: AadhaarNumber
+        pan_number: PanNumber
+        phone_number: PhoneNumber
+
+    number = with_check_digit("23456789012")
+    details = Details(aadhaar_number=number, pan_number="abcpe1234f", phone_number="9876543210")
+    assert (details.pan_number, details.phone_number) == ("ABCPE1234F", "+919876543210")
+
+    before = rejection_counts().get("pan", 0)
+    with pytest.raises(ValidationError):
+        Details(aadhaar_number=number, pan_number="bad", phone_number="9876543210")
+    assert rejection_counts()["pan"] == before + 1